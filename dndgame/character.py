@@ -1,9 +1,15 @@
-from typing import Dict, List, Optional
+import copy
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple, TypeVar
 
-from dndgame.dice import roll
-from dndgame.weapons import Weapon, WEAPONS
+from dndgame import log
+from dndgame.dice import get_rng, roll
+from dndgame.weapons import Weapon, get_weapon
 from dndgame.spells import Spell
 
+# The six ability scores, in their canonical order
+ABILITIES: Tuple[str, ...] = ("STR", "DEX", "CON", "INT", "WIS", "CHA")
+
 # Race configuration registry
 # Each race maps to a dictionary of ability score bonuses
 RACES: Dict[str, Dict[str, int]] = {
@@ -46,6 +52,12 @@ XP_TABLE: Dict[int, int] = {
     10: 64000,
 }
 
+# XP_TABLE flattened into a tuple indexed directly by level
+_XP_BY_LEVEL: Tuple[int, ...] = tuple(XP_TABLE.get(level, 0) for level in range(11))
+
+# Spell levels that use slots, in ascending order
+SPELL_LEVELS: Tuple[int, ...] = (1, 2, 3)
+
 # Spell slots by character level
 SPELL_SLOTS_BY_LEVEL: Dict[int, Dict[int, int]] = {
     1: {1: 2, 2: 0, 3: 0},
@@ -60,19 +72,48 @@ SPELL_SLOTS_BY_LEVEL: Dict[int, Dict[int, int]] = {
     10: {1: 4, 2: 3, 3: 3},
 }
 
+E = TypeVar("E", bound="Entity")
+
+# Unarmed, unnamed level 1 characters copied by Character.blank(), per class
+_BLANK_PROTOTYPES: Dict[type, "Character"] = {}
+
+# Every slot of each Entity class, base class slots first, for Entity.__copy__
+_ALL_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _all_slots(cls: type) -> Tuple[str, ...]:
+    """List every slot an instance of cls has, from the whole class hierarchy.
+
+    Args:
+        cls: An Entity class.
+
+    Returns:
+        The slot names, base class slots first.
+    """
+    slots = _ALL_SLOTS.get(cls)
+    if slots is None:
+        slots = _ALL_SLOTS[cls] = tuple(
+            slot
+            for klass in reversed(cls.__mro__)
+            for slot in klass.__dict__.get("__slots__", ())
+        )
+    return slots
+
 
 class Entity:
     """Base class for all entities in the game (characters, enemies, etc.).
 
     Attributes:
         name: The entity's name.
-        stats: Dictionary mapping ability score names to their values.
+        stats: Read-only mapping of ability score names to their values.
         hp: Current hit points.
         max_hp: Maximum hit points.
         armor_class: Armor class value.
         weapon: The entity's equipped weapon.
     """
 
+    __slots__ = ("name", "_stats", "_modifiers", "max_hp", "hp", "armor_class", "weapon")
+
     def __init__(
         self,
         name: str,
@@ -91,17 +132,82 @@ class Entity:
             weapon: The entity's equipped weapon (defaults to None).
         """
         self.name: str = name
-        self.stats: Dict[str, int] = stats
+        self.stats = stats
         self.max_hp: int = hp
         self.hp: int = hp
         self.armor_class: int = armor_class
-        self.weapon: Optional[Weapon] = weapon if weapon else WEAPONS["Club"]
+        self.weapon: Optional[Weapon] = weapon if weapon else get_weapon("Club")
+
+    @property
+    def stats(self) -> Mapping[str, int]:
+        """Read-only view of the ability scores.
+
+        Assign a new mapping to replace every score, or use set_stat() to
+        change one, so the cached modifiers always follow the scores.
+        """
+        return MappingProxyType(self._stats)
+
+    @stats.setter
+    def stats(self, stats: Mapping[str, int]) -> None:
+        self._stats: Dict[str, int] = dict(stats)
+        self._refresh_modifiers()
+
+    def set_stat(self, stat: str, value: int) -> None:
+        """Set one ability score and refresh the cached modifiers.
+
+        Args:
+            stat: The ability score name (e.g., "STR", "DEX", "CON").
+            value: The new score.
+        """
+        self._stats[stat] = value
+        self._refresh_modifiers()
+
+    def __copy__(self: E) -> E:
+        """Copy the entity without running __init__.
+
+        Every slot is copied, so subclasses only need to copy the mutable
+        containers they add. The copy gets its own stats and modifiers, so
+        changing its scores never changes the original; the weapon is
+        shared.
+
+        Returns:
+            A new entity of the same type with the same attributes.
+        """
+        entity = object.__new__(type(self))
+        for slot in _all_slots(type(self)):
+            setattr(entity, slot, getattr(self, slot))
+        entity._stats = dict(self._stats)
+        entity._modifiers = dict(self._modifiers)
+        return entity
+
+    def _update_stats(self, deltas: Mapping[str, int]) -> None:
+        """Add to several ability scores in place, then refresh the modifiers once.
+
+        Scores the entity does not have are left out.
+
+        Args:
+            deltas: Amounts to add, keyed by ability score name.
+        """
+        stats = self._stats
+        for stat, delta in deltas.items():
+            if stat in stats:
+                stats[stat] += delta
+        self._refresh_modifiers()
+
+    def _refresh_modifiers(self) -> None:
+        """Recompute the cached ability modifiers from the scores."""
+        self._modifiers: Dict[str, int] = {
+            # >> 1 floors like // 2, including for negative values
+            stat: (value - 10) >> 1
+            for stat, value in self._stats.items()
+        }
 
     def get_modifier(self, stat: str) -> int:
-        """Calculate ability modifier for a given ability score.
+        """Get the ability modifier for a given ability score.
 
         The modifier is calculated as (ability_score - 10) // 2, following
-        standard D&D rules.
+        standard D&D rules. Modifiers are cached and only recomputed when
+        the stats change.
 
         Args:
             stat: The ability score name (e.g., "STR", "DEX", "CON").
@@ -112,7 +218,16 @@ class Entity:
         Raises:
             KeyError: If the stat name is not in the stats dictionary.
         """
-        return (self.stats[stat] - 10) // 2
+        return self._modifiers[stat]
+
+    def get_modifiers(self) -> Dict[str, int]:
+        """Get the ability modifiers for every ability score at once.
+
+        Returns:
+            A new dictionary mapping ability score names to their cached
+            modifiers.
+        """
+        return dict(self._modifiers)
 
     def is_alive(self) -> bool:
         """Check if the entity is still alive.
@@ -129,7 +244,7 @@ class Character(Entity):
     Attributes:
         name: The character's name.
         race: The character's race (e.g., "Dwarf", "Elf", "Human").
-        stats: Dictionary mapping ability score names to their values.
+        stats: Read-only mapping of ability score names to their values.
         base_hp: Base hit points before modifiers.
         hp: Current hit points.
         max_hp: Maximum hit points.
@@ -141,6 +256,18 @@ class Character(Entity):
         max_spell_slots: Dictionary mapping spell levels to maximum slots.
     """
 
+    __slots__ = (
+        "race",
+        "base_hp",
+        "level",
+        "xp",
+        "known_spells",
+        "_known_spell_set",
+        "max_spell_slots",
+        "spell_slots",
+        "_spell_menu",
+    )
+
     def __init__(self, name: str, race: str, base_hp: int) -> None:
         """Initialize a new Character instance.
 
@@ -154,12 +281,52 @@ class Character(Entity):
         self.level: int = 1
         self.xp: int = 0
         self.known_spells: List[Spell] = []
+        # Mirrors known_spells for O(1) membership checks
+        self._known_spell_set: Set[Spell] = set()
         # Spell slots for level 1 character (cantrips have unlimited uses)
         self.max_spell_slots: Dict[int, int] = SPELL_SLOTS_BY_LEVEL[1].copy()
         self.spell_slots: Dict[int, int] = SPELL_SLOTS_BY_LEVEL[1].copy()
+        # Rendered by render_spell_menu(); None until spells or slots change
+        self._spell_menu: Optional[str] = None
         # Initialize Entity with empty stats - they'll be set by roll_stats()
         super().__init__(name, {}, 0)
 
+    @classmethod
+    def blank(cls) -> "Character":
+        """Create an unnamed level 1 character without running __init__.
+
+        The character is copied from a cached blank prototype, so every
+        attribute starts at an empty or starting value and the character
+        has no weapon. This is a cheap starting point for callers that
+        assign the attributes they need afterwards, such as test fixtures.
+
+        Returns:
+            A new Character with no name, race, stats, HP or weapon.
+        """
+        prototype = _BLANK_PROTOTYPES.get(cls)
+        if prototype is None:
+            prototype = _BLANK_PROTOTYPES[cls] = cls("", "", 0)
+            prototype.weapon = None
+        return copy.copy(prototype)
+
+    def __copy__(self) -> "Character":
+        """Copy the character without running __init__.
+
+        On top of Entity.__copy__, the copy gets its own known spells and
+        spell slot tables, so using it never changes the original. The
+        spells themselves and the spell menu (which is replaced, never
+        changed in place) are shared.
+
+        Returns:
+            A new Character with the same attributes as this one.
+        """
+        character = super().__copy__()
+        character.known_spells = list(self.known_spells)
+        character._known_spell_set = set(self._known_spell_set)
+        character.max_spell_slots = dict(self.max_spell_slots)
+        character.spell_slots = dict(self.spell_slots)
+        return character
+
     def roll_stats(self) -> None:
         """Roll ability scores and calculate hit points.
 
@@ -167,11 +334,10 @@ class Character(Entity):
         and updates the character's stats. Also calculates max_hp based on base_hp
         plus the Constitution modifier, and sets current hp to max_hp.
         """
-        print("Rolling stats...\n")
-        stats_list = ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
-        # Print rolling messages and create stats dict using comprehension
-        [print(f"Rolling {stat}...") for stat in stats_list]
-        self.stats = {stat: roll(6, 3) for stat in stats_list}
+        if log.VERBOSE:
+            print("Rolling stats...\n")
+            print("\n".join(f"Rolling {stat}..." for stat in ABILITIES))
+        self.stats = {stat: roll(6, 3) for stat in ABILITIES}
 
         self.max_hp = self.base_hp + self.get_modifier("CON")
         self.hp = self.max_hp
@@ -183,12 +349,9 @@ class Character(Entity):
         bonuses to the character's stats. If the race is not found in the
         registry, no bonuses are applied.
         """
-        if self.race in RACES:
-            bonuses = RACES[self.race]
-            # Apply bonuses only to existing stats using dict comprehension
-            self.stats = {
-                stat: self.stats[stat] + bonuses.get(stat, 0) for stat in self.stats
-            }
+        bonuses = RACES.get(self.race)
+        if bonuses:
+            self._update_stats(bonuses)
 
     def add_spell(self, spell: Spell) -> None:
         """Add a spell to the character's known spells.
@@ -196,8 +359,10 @@ class Character(Entity):
         Args:
             spell: The spell to add to known spells.
         """
-        if spell not in self.known_spells:
+        if spell not in self._known_spell_set:
+            self._known_spell_set.add(spell)
             self.known_spells.append(spell)
+            self._spell_menu = None
 
     def can_cast_spell(self, spell: Spell) -> bool:
         """Check if the character can cast a given spell.
@@ -208,7 +373,7 @@ class Character(Entity):
         Returns:
             True if the spell can be cast (in known spells and has slots available).
         """
-        if spell not in self.known_spells:
+        if spell not in self._known_spell_set:
             return False
         # Cantrips (level 0) can always be cast
         if spell.level == 0:
@@ -235,14 +400,16 @@ class Character(Entity):
         # Use a spell slot (unless it's a cantrip)
         if spell.level > 0:
             self.spell_slots[spell.level] -= 1
+            self._spell_menu = None
 
         # Cast the spell
         return spell.cast(self, target)
 
     def rest(self) -> None:
         """Take a rest to restore spell slots and HP."""
-        self.spell_slots = self.max_spell_slots.copy()
+        self.spell_slots.update(self.max_spell_slots)
         self.hp = self.max_hp
+        self._spell_menu = None
 
     def get_available_spells(self) -> List[Spell]:
         """Get list of spells that can currently be cast.
@@ -250,7 +417,33 @@ class Character(Entity):
         Returns:
             List of castable spells.
         """
-        return [spell for spell in self.known_spells if self.can_cast_spell(spell)]
+        # Cantrips are always castable; other levels need a free slot
+        ready_levels = {0}.union(
+            level for level, slots in self.spell_slots.items() if slots > 0
+        )
+        return [spell for spell in self.known_spells if spell.level in ready_levels]
+
+    def render_spell_menu(self) -> str:
+        """Render the numbered menu of spells that can currently be cast.
+
+        The menu is cached until a spell is learned or a spell slot is
+        used or restored.
+
+        Returns:
+            One line per castable spell, numbered like get_available_spells(),
+            with the remaining slots for leveled spells.
+        """
+        if self._spell_menu is None:
+            self._spell_menu = "\n".join(
+                f"{i}. {spell.name} - Level {spell.level}"
+                + (
+                    f" (Slots: {self.spell_slots[spell.level]}/{self.max_spell_slots[spell.level]})"
+                    if spell.level > 0
+                    else ""
+                )
+                for i, spell in enumerate(self.get_available_spells(), 1)
+            )
+        return self._spell_menu
 
     def get_xp_for_next_level(self) -> int:
         """Get XP required for next level.
@@ -260,7 +453,7 @@ class Character(Entity):
         """
         if self.level >= 10:
             return 0
-        return XP_TABLE[self.level + 1]
+        return _XP_BY_LEVEL[self.level + 1]
 
     def gain_xp(self, amount: int) -> bool:
         """Gain experience points and check for level up.
@@ -272,11 +465,11 @@ class Character(Entity):
             True if character leveled up, False otherwise.
         """
         self.xp += amount
-        print(f"\n+{amount} XP! (Total: {self.xp} XP)")
+        log.say(f"\n+{amount} XP! (Total: {self.xp} XP)")
 
         # Check for level up (can level up multiple times)
         leveled_up = False
-        while self.level < 10 and self.xp >= XP_TABLE[self.level + 1]:
+        while self.level < 10 and self.xp >= _XP_BY_LEVEL[self.level + 1]:
             self.level_up()
             leveled_up = True
         return leveled_up
@@ -286,9 +479,9 @@ class Character(Entity):
         old_level = self.level
         self.level += 1
 
-        print(f"\n{'='*50}")
-        print(f"LEVEL UP! You are now level {self.level}!")
-        print(f"{'='*50}")
+        log.say(f"\n{'='*50}")
+        log.say(f"LEVEL UP! You are now level {self.level}!")
+        log.say(f"{'='*50}")
 
         # Increase max HP (roll hit die + CON modifier)
         hp_increase = roll(10, 1) + self.get_modifier("CON")
@@ -296,30 +489,30 @@ class Character(Entity):
             hp_increase = 1
         self.max_hp += hp_increase
         self.hp = self.max_hp
-        print(f"Max HP increased by {hp_increase}! New max HP: {self.max_hp}")
-
-        # Update spell slots
-        self.max_spell_slots = SPELL_SLOTS_BY_LEVEL[self.level].copy()
-        self.spell_slots = SPELL_SLOTS_BY_LEVEL[self.level].copy()
+        log.say(f"Max HP increased by {hp_increase}! New max HP: {self.max_hp}")
 
-        # Show spell slot improvements
+        # Update spell slots in place
         old_slots = SPELL_SLOTS_BY_LEVEL[old_level]
         new_slots = SPELL_SLOTS_BY_LEVEL[self.level]
-        for spell_level in sorted(new_slots.keys()):
+        self.max_spell_slots.update(new_slots)
+        self.spell_slots.update(new_slots)
+        self._spell_menu = None
+
+        # Show spell slot improvements
+        for spell_level in SPELL_LEVELS:
             if new_slots[spell_level] > old_slots.get(spell_level, 0):
                 if old_slots.get(spell_level, 0) == 0:
-                    print(f"Gained Level {spell_level} spell slots: {new_slots[spell_level]}")
+                    log.say(f"Gained Level {spell_level} spell slots: {new_slots[spell_level]}")
                 else:
-                    print(
+                    log.say(
                         f"Level {spell_level} spell slots increased: {old_slots[spell_level]} -> {new_slots[spell_level]}"
                     )
 
         # Every 4 levels, increase a random stat by 1
         if self.level % 4 == 0:
-            stats_list = list(self.stats.keys())
-            improved_stat = stats_list[roll(len(stats_list), 1) - 1]
-            self.stats[improved_stat] += 1
-            print(
+            improved_stat = get_rng().choice(list(self.stats))
+            self.set_stat(improved_stat, self._stats[improved_stat] + 1)
+            log.say(
                 f"Ability Score Improvement! {improved_stat} increased to {self.stats[improved_stat]}"
             )
 
@@ -337,6 +530,8 @@ class Enemy(Entity):
         xp_value: Experience points awarded for defeating this enemy.
     """
 
+    __slots__ = ("xp_value",)
+
     def __init__(
         self,
         name: str,
@@ -358,3 +553,15 @@ class Enemy(Entity):
         """
         super().__init__(name, stats, hp, armor_class, weapon)
         self.xp_value: int = xp_value
+
+    def clone(self) -> "Enemy":
+        """Create a fresh copy of this enemy, such as a new one from a template.
+
+        Same as copy.copy(): skips __init__, gives the copy its own stats
+        and modifiers, and shares the weapon.
+
+        Returns:
+            A new Enemy with the same attributes as this one.
+        """
+        return copy.copy(self)
+
@@ -1,10 +1,31 @@
+from itertools import accumulate
 from typing import TYPE_CHECKING, List
 
-from dndgame.dice import roll
+from dndgame.dice import roll, roll_batch
 
 if TYPE_CHECKING:
     from dndgame.character import Entity
 
+# Simulated fights still undecided after this many rounds count as a loss
+MAX_ROUNDS = 20
+
+
+def _resolve_hit(attack_roll: int, str_mod: int, armor_class: int) -> bool:
+    """Check whether an attack roll hits.
+
+    Takes plain integers so callers can read entity attributes once and
+    reuse them across many attacks.
+
+    Args:
+        attack_roll: The unmodified d20 roll.
+        str_mod: The attacker's STR modifier.
+        armor_class: The defender's armor class.
+
+    Returns:
+        True if the attack hits, False otherwise.
+    """
+    return attack_roll + str_mod >= armor_class
+
 
 class Combat:
     """Manages combat encounters between entities."""
@@ -47,16 +68,103 @@ class Combat:
         Returns:
             The damage dealt to the defender, or 0 if the attack misses.
         """
-        attack_roll = roll(20, 1) + attacker.get_modifier("STR")
-        if attack_roll >= defender.armor_class:
-            # Use attacker's weapon damage dice
-            if attacker.weapon:
-                damage = roll(attacker.weapon.damage_die, attacker.weapon.damage_dice_count)
-            else:
-                # Fallback to unarmed strike (1 damage)
-                damage = 1
-            defender.hp -= damage
-            if defender.hp < 0:
-                defender.hp = 0
-            return damage
-        return 0
+        weapon = attacker.weapon
+        if not _resolve_hit(roll(20, 1), attacker.get_modifier("STR"), defender.armor_class):
+            return 0
+        # Use attacker's weapon damage dice, or an unarmed strike for 1 damage
+        damage = roll(weapon.damage_die, weapon.damage_dice_count) if weapon else 1
+        defender.hp = max(0, defender.hp - damage)
+        return damage
+
+    def simulate_batch(self, attacker: "Entity", defender: "Entity", n: int) -> List[int]:
+        """Simulate a series of attacks without changing either entity.
+
+        All attack and damage dice for the batch are drawn up front, which
+        makes this suitable for balance testing over many attacks.
+
+        Args:
+            attacker: The attacking entity.
+            defender: The defending entity.
+            n: The number of attacks to simulate.
+
+        Returns:
+            The defender's HP after each attack, never below 0.
+        """
+        damage = _damage_batch(attacker, defender, n)
+        return [max(0, defender.hp - total) for total in accumulate(damage)]
+
+
+def _damage_batch(attacker: "Entity", defender: "Entity", n: int) -> List[int]:
+    """Roll n attacks at once and return the damage each one deals.
+
+    Args:
+        attacker: The attacking entity.
+        defender: The defending entity.
+        n: The number of attacks to roll.
+
+    Returns:
+        The damage of each attack, 0 for a miss.
+    """
+    str_mod = attacker.get_modifier("STR")
+    armor_class = defender.armor_class
+    attack_rolls = roll_batch(20, 1, n)
+    weapon = attacker.weapon
+    if weapon:
+        damage_rolls = roll_batch(weapon.damage_die, weapon.damage_dice_count, n)
+    else:
+        damage_rolls = [1] * n
+    return [
+        damage if _resolve_hit(attack_roll, str_mod, armor_class) else 0
+        for attack_roll, damage in zip(attack_rolls, damage_rolls)
+    ]
+
+
+def _rounds_to_defeat(
+    attacker: "Entity", defender: "Entity", n_sims: int, max_rounds: int
+) -> List[int]:
+    """Find the round in which the attacker would defeat the defender.
+
+    Args:
+        attacker: The attacking entity.
+        defender: The defending entity.
+        n_sims: The number of fights to simulate.
+        max_rounds: The number of rounds simulated per fight.
+
+    Returns:
+        The zero-based round of the defeating attack in each fight, or
+        max_rounds if the defender survives them all.
+    """
+    damage = _damage_batch(attacker, defender, n_sims * max_rounds)
+    rounds = []
+    for start in range(0, n_sims * max_rounds, max_rounds):
+        totals = accumulate(damage[start : start + max_rounds])
+        rounds.append(
+            next((i for i, total in enumerate(totals) if total >= defender.hp), max_rounds)
+        )
+    return rounds
+
+
+def simulate_combats(
+    player: "Entity", enemy: "Entity", n_sims: int, max_rounds: int = MAX_ROUNDS
+) -> List[bool]:
+    """Simulate many fights between two entities without changing either.
+
+    As in the game, the player attacks first in every round. All dice for
+    all fights are drawn up front, so this is suited to balance testing
+    over thousands of fights.
+
+    Args:
+        player: The player entity.
+        enemy: The enemy entity.
+        n_sims: The number of fights to simulate.
+        max_rounds: The most rounds per fight; undecided fights are losses.
+
+    Returns:
+        Whether the player won each fight.
+    """
+    player_rounds = _rounds_to_defeat(player, enemy, n_sims, max_rounds)
+    enemy_rounds = _rounds_to_defeat(enemy, player, n_sims, max_rounds)
+    return [
+        player_round < max_rounds and player_round <= enemy_round
+        for player_round, enemy_round in zip(player_rounds, enemy_rounds)
+    ]
@@ -1,4 +1,75 @@
 import random
+import threading
+from typing import List, Optional, cast
+
+from dndgame import log
+
+# Rolls with at least this many dice draw every die in a single
+# random.choices() call instead of one random.randint() call per die.
+BULK_ROLL_THRESHOLD = 64
+
+# Per-thread generator override installed by set_rng()
+_local = threading.local()
+
+
+def set_rng(rng: Optional[random.Random]) -> None:
+    """
+    Use a dedicated random generator for rolls made on the current thread.
+
+    Seeding a generator per thread or worker process makes simulations
+    reproducible without sharing the global random state.
+
+    Args:
+        rng (Optional[random.Random]): The generator to use, or None to go
+            back to the module-level random functions.
+    """
+    _local.rng = rng
+
+
+def get_rng() -> random.Random:
+    """
+    Return the random generator used for rolls on the current thread.
+
+    Returns:
+        random.Random: The generator set with set_rng(), or the random
+            module itself if none was set.
+    """
+    return cast(random.Random, getattr(_local, "rng", None) or random)
+
+
+def _roll_dice(dice_type: int, number_of_dice: int) -> List[int]:
+    """
+    Roll the dice without any output.
+
+    Args:
+        dice_type (int): The number of sides on the dice.
+        number_of_dice (int): The number of dice to roll.
+
+    Returns:
+        List[int]: The individual die results.
+    """
+    rng = get_rng()
+    if number_of_dice >= BULK_ROLL_THRESHOLD:
+        return rng.choices(range(1, dice_type + 1), k=number_of_dice)
+    return [rng.randint(1, dice_type) for _ in range(number_of_dice)]
+
+
+def _roll_total(dice_type: int, number_of_dice: int) -> int:
+    """
+    Roll the dice without any output, keeping only the running total.
+
+    Args:
+        dice_type (int): The number of sides on the dice.
+        number_of_dice (int): The number of dice to roll.
+
+    Returns:
+        int: The total sum of the dice rolls.
+    """
+    rng = get_rng()
+    if number_of_dice >= BULK_ROLL_THRESHOLD:
+        return sum(rng.choices(range(1, dice_type + 1), k=number_of_dice))
+    randint = rng.randint
+    return sum(randint(1, dice_type) for _ in range(number_of_dice))
 
 
 def roll(dice_type: int, number_of_dice: int) -> int:
@@ -12,16 +83,42 @@ def roll(dice_type: int, number_of_dice: int) -> int:
     Returns:
         int: The total sum of the dice rolls.
     """
-    rolls = []
-    total = 0
-    for _ in range(number_of_dice):
-        roll_result = random.randint(1, dice_type)
-        rolls.append(roll_result)
-        total += roll_result
+    if not log.VERBOSE:
+        # Nobody sees the individual dice, so don't keep them
+        return _roll_total(dice_type, number_of_dice)
+    rolls = _roll_dice(dice_type, number_of_dice)
+    total = sum(rolls)
     print(f"Rolling {number_of_dice}d{dice_type}: {rolls} = {total}")
     return total
 
 
+def roll_batch(dice_type: int, number_of_dice: int, count: int) -> List[int]:
+    """
+    Make many rolls of the same dice at once, without any output.
+
+    Every die for the batch is drawn in one go, which is much faster than
+    calling roll() in a loop for simulations.
+
+    Args:
+        dice_type (int): The number of sides on the dice.
+        number_of_dice (int): The number of dice in each roll.
+        count (int): The number of rolls to make.
+
+    Returns:
+        List[int]: The total of each roll.
+    """
+    if number_of_dice <= 0:
+        # Like roll(), rolling no dice totals 0
+        return [0] * count
+    dice = _roll_dice(dice_type, number_of_dice * count)
+    if number_of_dice == 1:
+        return dice
+    return [
+        sum(dice[i : i + number_of_dice])
+        for i in range(0, number_of_dice * count, number_of_dice)
+    ]
+
+
 def roll_with_advantage(dice_type: int) -> int:
     """
     Roll a dice twice and return the higher result (advantage).
@@ -1,32 +1,298 @@
 """DungeonMaster class that uses OpenAI's API to narrate the game."""
 
+import asyncio
+import functools
+import json
 import os
-from typing import Optional
+import random
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, ParamSpec, Tuple, TypeVar
+
+import httpx
+import openai
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, AsyncStream
+from openai.types.chat import ChatCompletion, ChatCompletionChunk, ChatCompletionMessageParam
 
 # Load environment variables
 load_dotenv()
 
+# Every narration goes to the same host, so a small pool of kept-alive
+# connections lets each request after the first skip the TCP/TLS handshake.
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Narrations are cached per distinct event (narration method plus its
+# arguments). Each event collects up to NARRATION_VARIANTS texts from the
+# API, after which repeats are served from the cache at random so combat
+# stays varied without paying for another request.
+NARRATION_CACHE_SIZE = 512
+NARRATION_VARIANTS = 3
+
+# Pre-generated narrations written by scripts/pregenerate_narrations.py.
+# Texts use the placeholders below instead of character names.
+NARRATION_CORPUS_PATH = Path(__file__).with_name("narrations.json")
+ATTACKER_PLACEHOLDER = "{attacker}"
+DEFENDER_PLACEHOLDER = "{defender}"
+
+# Transient API failures are retried with exponential backoff, and
+# requests are throttled client-side so bursts of concurrent narrations
+# stay under the account's rate limits instead of triggering them.
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+MAX_CONCURRENT_REQUESTS = 8
+MAX_REQUESTS_PER_MINUTE = 500
+MAX_TOKENS_PER_MINUTE = 200_000
+
+# Printed before each narration written to stdout by the DungeonMaster
+NARRATION_PREFIX = "🎲 "
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def corpus_key(*parts: object) -> str:
+    """Build the lookup key for a pre-generated narration.
+
+    Args:
+        parts: The event kind followed by the details that identify it,
+            e.g. ("attack", "Longsword", "hit", 5).
+
+    Returns:
+        The key used in the narration corpus.
+    """
+    return "|".join(str(part) for part in parts)
+
+
+def spell_effect(damage: int) -> str:
+    """Describe a spell's effect for the spell_cast prompt.
+
+    Args:
+        damage: The damage dealt (negative for healing).
+
+    Returns:
+        The effect phrase, e.g. "dealing 5 damage".
+    """
+    if damage > 0:
+        return f"dealing {damage} damage"
+    if damage < 0:
+        return f"healing for {-damage} HP"
+    return "with magical energy"
+
+
+# Shared instructions sent first in every request. Keeping this prefix
+# identical across calls lets the API's automatic prompt caching reuse it.
+SYSTEM_PROMPT = (
+    "You are a Dungeon Master narrating a D&D combat encounter. "
+    "Write vivid, atmospheric narration and keep it concise."
+)
+
+
+def _with_retry(
+    max_attempts: int = RETRY_ATTEMPTS, base: float = RETRY_BASE_DELAY
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Retry a coroutine on transient API errors with exponential backoff.
+
+    Args:
+        max_attempts: The total number of attempts before giving up.
+        base: The delay in seconds before the first retry; it doubles on
+            each further retry, plus up to 0.1s of jitter.
+
+    Returns:
+        A decorator applying the retry policy. The last error is re-raised
+        once all attempts fail.
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            for attempt in range(max_attempts - 1):
+                try:
+                    return await func(*args, **kwargs)
+                except RETRYABLE_ERRORS:
+                    await asyncio.sleep(base * 2**attempt + random.random() * 0.1)
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _TokenBucket:
+    """Async token bucket that refills continuously up to its capacity."""
+
+    def __init__(self, capacity: float, per_seconds: float = 60.0) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            capacity: The most tokens that can be spent in one burst.
+            per_seconds: The time in seconds to refill an empty bucket.
+        """
+        self.capacity = capacity
+        self.rate = capacity / per_seconds
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until the given number of tokens is available and spend them.
+
+        Args:
+            amount: The number of tokens needed (capped at the capacity).
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+
+def _echo(narration: Optional[str], stream: bool) -> Optional[str]:
+    """Print a narration that did not come from a streamed response.
+
+    Cached and pre-generated narrations are printed whole, so streaming
+    callers see them the same way as text streamed from the API.
+
+    Args:
+        narration: The narration text, if any.
+        stream: Whether the caller asked for the narration to be printed.
+
+    Returns:
+        The narration, unchanged.
+    """
+    if stream and narration:
+        print(f"{NARRATION_PREFIX}{narration}")
+    return narration
+
 
 class DungeonMaster:
     """AI-powered Dungeon Master that narrates the game using OpenAI's API.
 
+    All narration methods are coroutines, so several narrations can be
+    requested concurrently with narrate_many(). Requests share one pooled
+    HTTP connection; call close() when done. The pool cannot be shared
+    across a fork, so each worker process must create its own instance.
+    Requests are throttled to the configured limits and retried with
+    backoff on rate-limit, connection and server errors.
+
     Attributes:
-        client: OpenAI client instance.
+        client: Async OpenAI client instance.
         model: The OpenAI model to use for narration.
         enabled: Whether the DM narration is enabled.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini", enabled: bool = True) -> None:
+    # Prompt template, max_tokens and temperature for each kind of narration
+    _TEMPLATES: Dict[str, Tuple[str, int, float]] = {
+        "combat_start": (
+            "A player character named {player} has just encountered a {enemy}.\n"
+            "Write a brief, vivid narration (2-3 sentences) describing the encounter as it begins.\n"
+            "Make it atmospheric and exciting, but keep it concise.",
+            150,
+            0.8,
+        ),
+        "attack_hit": (
+            "{attacker} attacked {defender} with a {weapon} and dealt {damage} damage.\n"
+            "Write a brief, vivid narration (1-2 sentences) describing this successful attack.\n"
+            "Make it exciting but concise.",
+            100,
+            0.8,
+        ),
+        "attack_miss": (
+            "{attacker} attacked {defender} with a {weapon} but missed.\n"
+            "Write a brief, vivid narration (1-2 sentences) describing this failed attack.\n"
+            "Make it engaging but concise.",
+            100,
+            0.8,
+        ),
+        "spell_cast": (
+            "{caster} cast {spell} on {target}, {effect}.\n"
+            "Write a brief, vivid narration (1-2 sentences) describing this spell being cast.\n"
+            "Make it magical and exciting but concise.",
+            100,
+            0.8,
+        ),
+        "victory": (
+            "{player} has defeated the {enemy}.\n"
+            "Write a brief, triumphant narration (1-2 sentences) describing the victory.\n"
+            "Make it satisfying and heroic but concise.",
+            100,
+            0.8,
+        ),
+        "defeat": (
+            "{player} has been defeated by the {enemy}.\n"
+            "Write a brief, dramatic narration (1-2 sentences) describing the defeat.\n"
+            "Make it tense but not overly grim, and keep it concise.",
+            100,
+            0.8,
+        ),
+        "action_choice": (
+            "It's {player}'s turn. They can {actions}.\n"
+            "Write a brief narration (1 sentence) asking what they will do.\n"
+            "Make it engaging and keep it very concise.",
+            50,
+            0.7,
+        ),
+    }
+
+    @classmethod
+    def prompt(cls, template_key: str, **fields: object) -> Tuple[str, int, float]:
+        """Fill in one of the prompt templates.
+
+        Args:
+            template_key: The key of the prompt template in _TEMPLATES.
+            fields: The values to fill into the template.
+
+        Returns:
+            The user prompt, max_tokens and temperature for the request.
+        """
+        template, max_tokens, temperature = cls._TEMPLATES[template_key]
+        return template.format(**fields), max_tokens, temperature
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        enabled: bool = True,
+        corpus_path: Path = NARRATION_CORPUS_PATH,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        max_requests_per_minute: int = MAX_REQUESTS_PER_MINUTE,
+        max_tokens_per_minute: int = MAX_TOKENS_PER_MINUTE,
+    ) -> None:
         """Initialize the DungeonMaster.
 
         Args:
             model: The OpenAI model to use (default: gpt-4o-mini for cost efficiency).
             enabled: Whether to enable DM narration (default: True).
+            corpus_path: JSON file of pre-generated narrations to use before
+                calling the API (ignored if the file does not exist).
+            max_concurrent_requests: Most API requests allowed in flight at once.
+            max_requests_per_minute: Request rate limit to stay under.
+            max_tokens_per_minute: Token rate limit to stay under, counting
+                the estimated prompt tokens plus max_tokens per request.
         """
         self.enabled = enabled
         self.model = model
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+        self._request_bucket = _TokenBucket(max_requests_per_minute)
+        self._token_bucket = _TokenBucket(max_tokens_per_minute)
+        self._narration_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._corpus: Dict[str, List[str]] = {}
+        if corpus_path.exists():
+            with open(corpus_path, encoding="utf-8") as corpus_file:
+                self._corpus = json.load(corpus_file)
 
         if self.enabled:
             api_key = os.getenv("OPENAI_API_KEY")
@@ -37,45 +303,205 @@ class DungeonMaster:
                 print("Add your API key to the .env file to enable narration.\n")
                 self.enabled = False
             else:
-                self.client = OpenAI(api_key=api_key)
+                self._http = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+                # Retries are handled by _with_retry on _send and _open_stream instead
+                self.client = AsyncOpenAI(
+                    api_key=api_key, http_client=self._http, max_retries=0
+                )
 
-    def narrate_combat_start(self, player_name: str, enemy_name: str) -> Optional[str]:
-        """Narrate the start of a combat encounter.
+    def _from_corpus(self, key: str, attacker_name: str, defender_name: str) -> Optional[str]:
+        """Look up a pre-generated narration and fill in the names.
 
         Args:
-            player_name: The name of the player character.
-            enemy_name: The name of the enemy.
+            key: The corpus key of the event.
+            attacker_name: The name of the acting character.
+            defender_name: The name of the target.
 
         Returns:
-            The narration text, or None if disabled.
+            A random matching narration, or None if there is none.
+        """
+        variants = self._corpus.get(key)
+        if not variants:
+            return None
+        return (
+            random.choice(variants)
+            .replace(ATTACKER_PLACEHOLDER, attacker_name)
+            .replace(DEFENDER_PLACEHOLDER, defender_name)
+        )
+
+    @_with_retry()
+    async def _send(
+        self, messages: List[ChatCompletionMessageParam], max_tokens: int, temperature: float
+    ) -> ChatCompletion:
+        """Send a completion request, retrying transient errors.
+
+        Args:
+            messages: The system and user messages.
+            max_tokens: The most tokens the reply may use.
+            temperature: The sampling temperature.
+
+        Returns:
+            The complete response.
+        """
+        return await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+    @_with_retry()
+    async def _open_stream(
+        self, messages: List[ChatCompletionMessageParam], max_tokens: int, temperature: float
+    ) -> AsyncStream[ChatCompletionChunk]:
+        """Open a streamed completion request, retrying transient errors.
+
+        Only opening the stream is retried. Once tokens have been printed,
+        retrying would print the narration a second time, so errors while
+        reading the stream are left to the caller.
+
+        Args:
+            messages: The system and user messages.
+            max_tokens: The most tokens the reply may use.
+            temperature: The sampling temperature.
+
+        Returns:
+            The stream of response chunks.
+        """
+        return await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+
+    async def _create_completion(
+        self, prompt: str, max_tokens: int, temperature: float, stream: bool = False
+    ) -> Optional[str]:
+        """Request a narration within the configured rate limits.
+
+        Args:
+            prompt: The user prompt, sent after the shared system prompt.
+            max_tokens: The most tokens the reply may use.
+            temperature: The sampling temperature.
+            stream: Print the reply to stdout token by token as it arrives.
+
+        Returns:
+            The text of the reply.
+        """
+        messages: List[ChatCompletionMessageParam] = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+        # Roughly four characters per token, as in OpenAI's own estimates
+        prompt_tokens = (len(SYSTEM_PROMPT) + len(prompt)) // 4
+        await self._request_bucket.acquire()
+        await self._token_bucket.acquire(prompt_tokens + max_tokens)
+        async with self._request_slots:
+            if not stream:
+                response = await self._send(messages, max_tokens, temperature)
+                return response.choices[0].message.content
+
+            chunks = await self._open_stream(messages, max_tokens, temperature)
+            parts: List[str] = []
+            async for chunk in chunks:
+                token = chunk.choices[0].delta.content if chunk.choices else None
+                if token:
+                    print(token if parts else f"{NARRATION_PREFIX}{token}", end="", flush=True)
+                    parts.append(token)
+            if parts:
+                print()
+            return "".join(parts) or None
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connections, if any were opened."""
+        if hasattr(self, "_http"):
+            await self._http.aclose()
+
+    async def _narrate(
+        self,
+        template_key: str,
+        *,
+        stream: bool,
+        corpus: Optional[Tuple[str, str, str]] = None,
+        **fields: str,
+    ) -> Optional[str]:
+        """Narrate an event from one of the prompt templates.
+
+        Pre-generated narrations are used first, then the cache, and only
+        then the API. Every narrate_* method goes through here.
+
+        Args:
+            template_key: The key of the prompt template in _TEMPLATES.
+            stream: Print the narration to stdout as it arrives.
+            corpus: The corpus key, attacker name and defender name of the
+                event, if it may have pre-generated narrations.
+            fields: The values to fill into the template.
+
+        Returns:
+            The narration text, or None if disabled or the request failed.
         """
         if not self.enabled:
             return None
 
-        prompt = f"""You are a Dungeon Master narrating a D&D combat encounter.
-A player character named {player_name} has just encountered a {enemy_name}.
-Write a brief, vivid narration (2-3 sentences) describing the encounter as it begins.
-Make it atmospheric and exciting, but keep it concise."""
+        if corpus is not None:
+            narration = self._from_corpus(*corpus)
+            if narration is not None:
+                return _echo(narration, stream)
+
+        key = repr((template_key, sorted(fields.items())))
+        cache = self._narration_cache
+        variants = cache.get(key)
+        if variants is not None:
+            cache.move_to_end(key)
+            if len(variants) >= NARRATION_VARIANTS:
+                return _echo(random.choice(variants), stream)
 
+        prompt, max_tokens, temperature = self.prompt(template_key, **fields)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.8,
+            narration = await self._create_completion(
+                prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=stream,
             )
-            return response.choices[0].message.content
         except Exception as e:
             print(f"\n⚠️  DM narration error: {e}")
             return None
 
-    def narrate_attack(
+        if narration is not None:
+            cache.setdefault(key, []).append(narration)
+            if len(cache) > NARRATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return narration
+
+    async def narrate_combat_start(
+        self, player_name: str, enemy_name: str, *, stream: bool = False
+    ) -> Optional[str]:
+        """Narrate the start of a combat encounter.
+
+        Args:
+            player_name: The name of the player character.
+            enemy_name: The name of the enemy.
+            stream: Print the narration to stdout as it arrives.
+
+        Returns:
+            The narration text, or None if disabled.
+        """
+        return await self._narrate(
+            "combat_start", stream=stream, player=player_name, enemy=enemy_name
+        )
+
+    async def narrate_attack(
         self,
         attacker_name: str,
         defender_name: str,
         weapon_name: str,
         damage: int,
         hit: bool,
+        *,
+        stream: bool = False,
     ) -> Optional[str]:
         """Narrate a weapon attack.
 
@@ -85,42 +511,34 @@ Make it atmospheric and exciting, but keep it concise."""
             weapon_name: The name of the weapon used.
             damage: The damage dealt (0 if missed).
             hit: Whether the attack hit.
+            stream: Print the narration to stdout as it arrives.
 
         Returns:
             The narration text, or None if disabled.
         """
-        if not self.enabled:
-            return None
-
-        if hit:
-            prompt = f"""You are a Dungeon Master narrating a D&D combat action.
-{attacker_name} attacked {defender_name} with a {weapon_name} and dealt {damage} damage.
-Write a brief, vivid narration (1-2 sentences) describing this successful attack.
-Make it exciting but concise."""
-        else:
-            prompt = f"""You are a Dungeon Master narrating a D&D combat action.
-{attacker_name} attacked {defender_name} with a {weapon_name} but missed.
-Write a brief, vivid narration (1-2 sentences) describing this failed attack.
-Make it engaging but concise."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=100,
-                temperature=0.8,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"\n⚠️  DM narration error: {e}")
-            return None
-
-    def narrate_spell_cast(
+        outcome = "hit" if hit else "miss"
+        return await self._narrate(
+            f"attack_{outcome}",
+            stream=stream,
+            corpus=(
+                corpus_key("attack", weapon_name, outcome, damage if hit else 0),
+                attacker_name,
+                defender_name,
+            ),
+            attacker=attacker_name,
+            defender=defender_name,
+            weapon=weapon_name,
+            damage=str(damage),
+        )
+
+    async def narrate_spell_cast(
         self,
         caster_name: str,
         target_name: str,
         spell_name: str,
         damage: int,
+        *,
+        stream: bool = False,
     ) -> Optional[str]:
         """Narrate a spell being cast.
 
@@ -129,126 +547,82 @@ Make it engaging but concise."""
             target_name: The name of the target.
             spell_name: The name of the spell.
             damage: The damage dealt (negative for healing).
+            stream: Print the narration to stdout as it arrives.
 
         Returns:
             The narration text, or None if disabled.
         """
-        if not self.enabled:
-            return None
-
-        if damage > 0:
-            effect = f"dealing {damage} damage"
-        elif damage < 0:
-            effect = f"healing for {-damage} HP"
-        else:
-            effect = "with magical energy"
-
-        prompt = f"""You are a Dungeon Master narrating a D&D combat action.
-{caster_name} cast {spell_name} on {target_name}, {effect}.
-Write a brief, vivid narration (1-2 sentences) describing this spell being cast.
-Make it magical and exciting but concise."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=100,
-                temperature=0.8,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"\n⚠️  DM narration error: {e}")
-            return None
-
-    def narrate_victory(self, player_name: str, enemy_name: str) -> Optional[str]:
+        return await self._narrate(
+            "spell_cast",
+            stream=stream,
+            corpus=(corpus_key("spell", spell_name, damage), caster_name, target_name),
+            caster=caster_name,
+            target=target_name,
+            spell=spell_name,
+            effect=spell_effect(damage),
+        )
+
+    async def narrate_victory(
+        self, player_name: str, enemy_name: str, *, stream: bool = False
+    ) -> Optional[str]:
         """Narrate a combat victory.
 
         Args:
             player_name: The name of the victorious player.
             enemy_name: The name of the defeated enemy.
+            stream: Print the narration to stdout as it arrives.
 
         Returns:
             The narration text, or None if disabled.
         """
-        if not self.enabled:
-            return None
-
-        prompt = f"""You are a Dungeon Master narrating a D&D combat encounter.
-{player_name} has defeated the {enemy_name}.
-Write a brief, triumphant narration (1-2 sentences) describing the victory.
-Make it satisfying and heroic but concise."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=100,
-                temperature=0.8,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"\n⚠️  DM narration error: {e}")
-            return None
+        return await self._narrate("victory", stream=stream, player=player_name, enemy=enemy_name)
 
-    def narrate_defeat(self, player_name: str, enemy_name: str) -> Optional[str]:
+    async def narrate_defeat(
+        self, player_name: str, enemy_name: str, *, stream: bool = False
+    ) -> Optional[str]:
         """Narrate a player defeat.
 
         Args:
             player_name: The name of the defeated player.
             enemy_name: The name of the victorious enemy.
+            stream: Print the narration to stdout as it arrives.
 
         Returns:
             The narration text, or None if disabled.
         """
-        if not self.enabled:
-            return None
-
-        prompt = f"""You are a Dungeon Master narrating a D&D combat encounter.
-{player_name} has been defeated by the {enemy_name}.
-Write a brief, dramatic narration (1-2 sentences) describing the defeat.
-Make it tense but not overly grim, and keep it concise."""
+        return await self._narrate("defeat", stream=stream, player=player_name, enemy=enemy_name)
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=100,
-                temperature=0.8,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"\n⚠️  DM narration error: {e}")
-            return None
-
-    def narrate_action_choice(
-        self, player_name: str, available_actions: list[str]
+    async def narrate_action_choice(
+        self, player_name: str, available_actions: list[str], *, stream: bool = False
     ) -> Optional[str]:
         """Narrate a player's turn and available actions.
 
         Args:
             player_name: The name of the player.
             available_actions: List of available actions (e.g., ["Attack", "Cast Spell", "Run"]).
+            stream: Print the narration to stdout as it arrives.
 
         Returns:
             The narration text, or None if disabled.
         """
-        if not self.enabled:
-            return None
-
         actions_str = ", ".join(available_actions[:-1]) + f", or {available_actions[-1]}"
-        prompt = f"""You are a Dungeon Master narrating a D&D combat turn.
-It's {player_name}'s turn. They can {actions_str}.
-Write a brief narration (1 sentence) asking what they will do.
-Make it engaging and keep it very concise."""
+        return await self._narrate(
+            "action_choice", stream=stream, player=player_name, actions=actions_str
+        )
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=50,
-                temperature=0.7,
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"\n⚠️  DM narration error: {e}")
-            return None
+    async def narrate_many(
+        self, *narrations: Awaitable[Optional[str]]
+    ) -> List[Optional[str]]:
+        """Run several narration requests concurrently.
+
+        Total latency is that of the slowest request instead of the sum.
+
+        Args:
+            narrations: Awaitables returned by the narrate_* methods.
+
+        Returns:
+            The narration texts in the order given, with None for any
+            narration that is disabled or failed.
+        """
+        results = await asyncio.gather(*narrations, return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
@@ -0,0 +1,18 @@
+"""Opt-in console output for game events.
+
+Output is off by default so tests and batch simulations skip both the
+message formatting and the I/O; the interactive game switches it on.
+"""
+
+# Set to True to print dice rolls, stat rolls, XP gains and level-ups.
+VERBOSE = False
+
+
+def say(message: str) -> None:
+    """Print a message if verbose output is enabled.
+
+    Args:
+        message: The message to print.
+    """
+    if VERBOSE:
+        print(message)
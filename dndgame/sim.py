@@ -0,0 +1,71 @@
+"""Struct-of-arrays helpers for simulating many encounters at once."""
+
+from array import array
+from typing import TYPE_CHECKING, List, Sequence
+
+from dndgame.combat import _resolve_hit
+
+if TYPE_CHECKING:
+    from dndgame.character import Enemy
+
+
+class EnemyPool:
+    """Many enemies stored as parallel arrays instead of one object each.
+
+    Each attribute is a compact typed array indexed by enemy, so bulk
+    combat resolution walks contiguous buffers rather than separate
+    Enemy objects.
+
+    Attributes:
+        hp: Current hit points of each enemy.
+        ac: Armor class of each enemy.
+        alive: 1 for each enemy still standing, 0 otherwise.
+    """
+
+    __slots__ = ("hp", "ac", "alive")
+
+    def __init__(self, enemies: Sequence["Enemy"]) -> None:
+        """Copy the combat attributes of the given enemies into the pool.
+
+        The enemies themselves are not changed by anything done to the pool.
+
+        Args:
+            enemies: The enemies to simulate.
+        """
+        self.hp = array("h", (enemy.hp for enemy in enemies))
+        self.ac = array("b", (enemy.armor_class for enemy in enemies))
+        self.alive = bytearray(1 if enemy.hp > 0 else 0 for enemy in enemies)
+
+    def __len__(self) -> int:
+        """Return the number of enemies in the pool.
+
+        Returns:
+            The pool size, including defeated enemies.
+        """
+        return len(self.hp)
+
+    def resolve_attacks(
+        self, attack_rolls: Sequence[int], damage_rolls: Sequence[int], str_mod: int = 0
+    ) -> List[int]:
+        """Resolve one player attack against every enemy in the pool.
+
+        Defeated enemies are skipped. Hits reduce the enemy's HP, never
+        below 0, and an enemy at 0 HP is marked as no longer alive.
+
+        Args:
+            attack_rolls: The d20 attack roll against each enemy.
+            damage_rolls: The damage each attack deals if it hits.
+            str_mod: The attacking player's STR modifier.
+
+        Returns:
+            The damage dealt to each enemy, 0 for a miss or a defeated enemy.
+        """
+        hp, ac, alive = self.hp, self.ac, self.alive
+        dealt = [0] * len(hp)
+        for i, (attack_roll, damage) in enumerate(zip(attack_rolls, damage_rolls)):
+            if alive[i] and _resolve_hit(attack_roll, str_mod, ac[i]):
+                dealt[i] = damage
+                hp[i] = max(0, hp[i] - damage)
+                if not hp[i]:
+                    alive[i] = 0
+        return dealt
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:
     from dndgame.character import Entity
@@ -14,6 +14,8 @@ class Spell:
         spell_power: The power/damage of the spell.
     """
 
+    __slots__ = ("name", "level", "school", "spell_power")
+
     def __init__(self, name: str, level: int, school: str, spell_power: int) -> None:
         """Initialize a spell instance.
 
@@ -38,14 +40,28 @@ class Spell:
         Returns:
             The damage dealt to the target.
         """
-        damage = self.spell_power + caster.get_modifier("INT")
-        if damage < 0:
-            damage = 0
-        target.hp -= damage
-        if target.hp < 0:
-            target.hp = 0
+        damage = max(0, self.spell_power + caster.get_modifier("INT"))
+        target.hp = max(0, target.hp - damage)
         return damage
 
+    def cast_batch(self, int_mods: Sequence[int], target_hps: Sequence[int]) -> List[int]:
+        """Work out the result of many casts at once without any entities.
+
+        Each cast pairs one caster INT modifier with one target HP, which
+        suits balance simulations over thousands of casts.
+
+        Args:
+            int_mods: The INT modifier of the caster for each cast.
+            target_hps: The target's HP before each cast.
+
+        Returns:
+            The target's HP after each cast, never below 0.
+        """
+        power = self.spell_power
+        return [
+            max(0, hp - max(0, power + int_mod)) for int_mod, hp in zip(int_mods, target_hps)
+        ]
+
     def __str__(self) -> str:
         """Return a string representation of the spell.
 
@@ -57,11 +73,16 @@ class Spell:
 
 
 class SpellBook:
+    __slots__ = ("spells", "_cache")
+
     def __init__(self) -> None:
         """
         Initialize a spellbook instance.
         """
         self.spells: list[Spell] = []
+        # Answers to get_available_spells() by level; the cache is cleared
+        # whenever a spell is added
+        self._cache: dict[int, tuple[Spell, ...]] = {}
 
     def add_spell(self, spell: Spell) -> None:
         """
@@ -71,6 +92,7 @@ class SpellBook:
             spell (Spell): The spell to add.
         """
         self.spells.append(spell)
+        self._cache.clear()
 
     def get_available_spells(self, spell_level: int) -> list[Spell]:
         """
@@ -80,33 +102,85 @@ class SpellBook:
             spell_level (int): The level of spells to retrieve.
 
         Returns:
-            list[Spell]: A list of spells available for the given level.
+            list[Spell]: A new list of the spells available for the given
+            level, in the order they were added.
         """
-        available = []
-        for spell in self.spells:
-            if spell.level <= spell_level:
-                available.append(spell)
-        return available
+        available = self._cache.get(spell_level)
+        if available is None:
+            available = tuple(spell for spell in self.spells if spell.level <= spell_level)
+            self._cache[spell_level] = available
+        return list(available)
 
 
-# Spell registry with common D&D spells
-SPELLS: Dict[str, Spell] = {
+# Level, school and power of common D&D spells. Spell objects are only
+# built when first looked up, through get_spell() or SPELLS.
+_SPELL_SPECS: Dict[str, Tuple[int, str, int]] = {
     # Cantrips (Level 0)
-    "Fire Bolt": Spell("Fire Bolt", 0, "Evocation", 5),
-    "Ray of Frost": Spell("Ray of Frost", 0, "Evocation", 4),
-    "Shocking Grasp": Spell("Shocking Grasp", 0, "Evocation", 4),
+    "Fire Bolt": (0, "Evocation", 5),
+    "Ray of Frost": (0, "Evocation", 4),
+    "Shocking Grasp": (0, "Evocation", 4),
     # Level 1 Spells
-    "Magic Missile": Spell("Magic Missile", 1, "Evocation", 7),
-    "Burning Hands": Spell("Burning Hands", 1, "Evocation", 6),
-    "Shield": Spell("Shield", 1, "Abjuration", 0),  # Defensive spell
-    "Cure Wounds": Spell("Cure Wounds", 1, "Evocation", -5),  # Healing spell (negative damage)
+    "Magic Missile": (1, "Evocation", 7),
+    "Burning Hands": (1, "Evocation", 6),
+    "Shield": (1, "Abjuration", 0),  # Defensive spell
+    "Cure Wounds": (1, "Evocation", -5),  # Healing spell (negative damage)
     # Level 2 Spells
-    "Scorching Ray": Spell("Scorching Ray", 2, "Evocation", 10),
-    "Shatter": Spell("Shatter", 2, "Evocation", 9),
+    "Scorching Ray": (2, "Evocation", 10),
+    "Shatter": (2, "Evocation", 9),
     # Level 3 Spells
-    "Fireball": Spell("Fireball", 3, "Evocation", 15),
-    "Lightning Bolt": Spell("Lightning Bolt", 3, "Evocation", 14),
+    "Fireball": (3, "Evocation", 15),
+    "Lightning Bolt": (3, "Evocation", 14),
 }
+_cache: Dict[str, Spell] = {}
+
+
+def get_spell(name: str) -> Spell:
+    """Look up a pre-defined spell, building it on first use.
+
+    Args:
+        name: The spell's name.
+
+    Returns:
+        The shared Spell instance for that name.
+
+    Raises:
+        KeyError: If there is no pre-defined spell with that name.
+    """
+    spell = _cache.get(name)
+    if spell is None:
+        level, school, spell_power = _SPELL_SPECS[name]
+        spell = _cache[name] = Spell(name, level, school, spell_power)
+    return spell
+
+
+def __getattr__(name: str) -> Dict[str, Spell]:
+    """Build the SPELLS registry the first time it is imported.
+
+    Args:
+        name: The module attribute being looked up.
+
+    Returns:
+        The spell registry, mapping names to Spell objects.
+
+    Raises:
+        AttributeError: If the attribute is not SPELLS.
+    """
+    if name != "SPELLS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _build_registry()
+
+
+def _build_registry() -> Dict[str, Spell]:
+    """Build the SPELLS registry, or return it if it was already built.
+
+    Returns:
+        The spell registry, mapping names to Spell objects.
+    """
+    registry: Optional[Dict[str, Spell]] = globals().get("SPELLS")
+    if registry is None:
+        registry = {spell_name: get_spell(spell_name) for spell_name in _SPELL_SPECS}
+        globals()["SPELLS"] = registry
+    return registry
 
 
 def get_spellbook() -> Dict[str, Spell]:
@@ -115,4 +189,4 @@ def get_spellbook() -> Dict[str, Spell]:
     Returns:
         A dictionary of spell names to Spell objects.
     """
-    return SPELLS
+    return _build_registry()
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
 class Weapon:
@@ -10,6 +10,8 @@ class Weapon:
         damage_dice_count: The number of damage dice to roll (default 1).
     """
 
+    __slots__ = ("name", "damage_die", "damage_dice_count")
+
     def __init__(self, name: str, damage_die: int, damage_dice_count: int = 1) -> None:
         """Initialize a Weapon instance.
 
@@ -31,15 +33,68 @@ class Weapon:
         return f"{self.name} ({self.damage_dice_count}d{self.damage_die})"
 
 
-# Weapon registry with pre-defined weapons
-WEAPONS: Dict[str, Weapon] = {
-    "Dagger": Weapon("Dagger", damage_die=4),
-    "Shortsword": Weapon("Shortsword", damage_die=6),
-    "Longsword": Weapon("Longsword", damage_die=8),
-    "Battleaxe": Weapon("Battleaxe", damage_die=8),
-    "Greatsword": Weapon("Greatsword", damage_die=6, damage_dice_count=2),
-    "Greataxe": Weapon("Greataxe", damage_die=12),
-    "Club": Weapon("Club", damage_die=4),
-    "Mace": Weapon("Mace", damage_die=6),
-    "Warhammer": Weapon("Warhammer", damage_die=8),
+# Damage die and dice count of each pre-defined weapon. Weapon objects are
+# only built when first looked up, through get_weapon() or WEAPONS.
+_WEAPON_SPECS: Dict[str, Tuple[int, int]] = {
+    "Dagger": (4, 1),
+    "Shortsword": (6, 1),
+    "Longsword": (8, 1),
+    "Battleaxe": (8, 1),
+    "Greatsword": (6, 2),
+    "Greataxe": (12, 1),
+    "Club": (4, 1),
+    "Mace": (6, 1),
+    "Warhammer": (8, 1),
 }
+_cache: Dict[str, Weapon] = {}
+
+
+def get_weapon(name: str) -> Weapon:
+    """Look up a pre-defined weapon, building it on first use.
+
+    Args:
+        name: The weapon's name.
+
+    Returns:
+        The shared Weapon instance for that name.
+
+    Raises:
+        KeyError: If there is no pre-defined weapon with that name.
+    """
+    weapon = _cache.get(name)
+    if weapon is None:
+        damage_die, damage_dice_count = _WEAPON_SPECS[name]
+        weapon = _cache[name] = Weapon(name, damage_die, damage_dice_count)
+    return weapon
+
+
+def __getattr__(name: str) -> Dict[str, Weapon]:
+    """Build the WEAPONS registry the first time it is imported.
+
+    Args:
+        name: The module attribute being looked up.
+
+    Returns:
+        The weapon registry, mapping names to Weapon instances.
+
+    Raises:
+        AttributeError: If the attribute is not WEAPONS.
+    """
+    if name != "WEAPONS":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _build_registry()
+
+
+def _build_registry() -> Dict[str, Weapon]:
+    """Build the WEAPONS registry, or return it if it was already built.
+
+    Returns:
+        The weapon registry, mapping names to Weapon instances.
+    """
+    registry: Optional[Dict[str, Weapon]] = globals().get("WEAPONS")
+    if registry is None:
+        registry = {
+            weapon_name: get_weapon(weapon_name) for weapon_name in _WEAPON_SPECS
+        }
+        globals()["WEAPONS"] = registry
+    return registry
@@ -1,8 +1,132 @@
+import asyncio
+import sys
+from typing import Awaitable, Optional, Set
+
+from dndgame import log
 from dndgame.character import RACES, Character, Enemy
 from dndgame.combat import Combat
 from dndgame.weapons import WEAPONS
-from dndgame.spells import SPELLS
-from dndgame.dungeon_master import DungeonMaster
+from dndgame.spells import SPELLS, Spell
+from dndgame.dungeon_master import NARRATION_PREFIX, DungeonMaster
+
+# Character creation menus built once from the registries, since they never change
+_RACE_LIST = tuple(RACES)
+_RACE_MENU = "\n".join(
+    f"{i}. {race_name} ({', '.join(('+' if bonus >= 0 else '') + str(bonus) + ' ' + stat for stat, bonus in RACES[race_name].items())})"
+    for i, race_name in enumerate(_RACE_LIST, start=1)
+)
+_RACE_PROMPT = f"Enter choice (1-{len(_RACE_LIST)}): "
+_RACE_BY_KEY = {str(i): race_name for i, race_name in enumerate(_RACE_LIST, start=1)}
+_WEAPON_LIST = tuple(WEAPONS)
+_WEAPON_MENU = "\n".join(
+    f"{i}. {WEAPONS[weapon_name]}" for i, weapon_name in enumerate(_WEAPON_LIST, start=1)
+)
+_WEAPON_PROMPT = f"Enter choice (1-{len(_WEAPON_LIST)}): "
+_WEAPON_BY_KEY = {str(i): WEAPONS[name] for i, name in enumerate(_WEAPON_LIST, start=1)}
+_SPELL_LIST = tuple(SPELLS)
+_SPELL_MENU = "\n".join(
+    f"{i}. {SPELLS[spell_name]}" for i, spell_name in enumerate(_SPELL_LIST, start=1)
+)
+_SPELL_BY_KEY = {str(i): SPELLS[name] for i, name in enumerate(_SPELL_LIST, start=1)}
+
+# Fixed menus and their valid answers
+_COMBAT_MENU = "\n1. Attack with weapon\n2. Cast spell\n3. Run away\n\n"
+_MAIN_CHOICES = frozenset({"1", "2", "3", "4"})
+_COMBAT_CHOICES = frozenset({"1", "2", "3"})
+_YES_NO_CHOICES = frozenset({"1", "2"})
+
+# Every spell level a slot table can hold, in display order
+_SPELL_LEVEL_ORDER = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+# Template every encounter's goblin is cloned from
+_GOBLIN = Enemy(
+    "Goblin",
+    {"STR": 8, "DEX": 14, "CON": 10, "INT": 10, "WIS": 8, "CHA": 8},
+    hp=5,
+    armor_class=10,
+    weapon=WEAPONS["Shortsword"],
+    xp_value=50,
+)
+
+
+def _read(prompt: str = "") -> str:
+    """Read one line of player input.
+
+    A lighter replacement for input(): it writes the prompt straight to
+    stdout, only flushing when there is a prompt, and skips the stderr
+    flush input() does on every call.
+
+    Args:
+        prompt: Text to show before reading.
+
+    Returns:
+        The line entered, without its trailing newline.
+
+    Raises:
+        EOFError: If stdin is closed, as input() would.
+    """
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line[:-1] if line.endswith("\n") else line
+
+
+class NarrationPrinter:
+    """Prints DM narrations in the order they were requested.
+
+    Each narration is started as a task as soon as it is submitted, so its
+    API request runs while the rest of the turn is resolved. A background
+    task drains the queue and prints the results in submission order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue and start the background printer task."""
+        self._queue: "asyncio.Queue[Optional[asyncio.Future[Optional[str]]]]" = asyncio.Queue()
+        self._printer = asyncio.create_task(self._print_in_order())
+
+    async def _print_in_order(self) -> None:
+        """Print each queued narration once it is ready, until closed.
+
+        A narration that raises is reported and skipped, so the printer
+        keeps draining the queue and flush() never waits on a dead task.
+        """
+        while True:
+            pending = await self._queue.get()
+            try:
+                if pending is None:
+                    return
+                try:
+                    narration = await pending
+                except Exception as e:
+                    # Skip the failed narration so later ones still print
+                    print(f"\n⚠️  DM narration error: {e}")
+                    continue
+                if narration:
+                    print(f"{NARRATION_PREFIX}{narration}")
+            finally:
+                self._queue.task_done()
+
+    async def submit(self, narration: Awaitable[Optional[str]]) -> None:
+        """Start a narration and queue it for printing.
+
+        Args:
+            narration: A pending DungeonMaster narration.
+        """
+        self._queue.put_nowait(asyncio.ensure_future(narration))
+        # Yield once so the request goes out before the caller carries on
+        await asyncio.sleep(0)
+
+    async def flush(self) -> None:
+        """Wait until every submitted narration has been printed."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Print any remaining narrations and stop the printer task."""
+        self._queue.put_nowait(None)
+        await self._printer
 
 
 def create_character() -> Character:
@@ -16,55 +140,24 @@ def create_character() -> Character:
     """
     print("Welcome to D&D Adventure!")
     while True:
-        name = input("Enter your character's name: ").strip()
+        name = _read("Enter your character's name: ").strip()
         if name:
             break
         print("Name cannot be empty. Please enter a valid name.")
 
-    # Dynamically generate race menu from RACES registry
     print("\nChoose your race:")
-    race_list = list(RACES.keys())
-    # Generate menu items using list comprehension and print them
-    menu_items = [
-        f"{i}. {race_name} ({', '.join(('+' if bonus >= 0 else '') + str(bonus) + ' ' + stat for stat, bonus in RACES[race_name].items())})"
-        for i, race_name in enumerate(race_list, start=1)
-    ]
-    print("\n".join(menu_items))
+    print(_RACE_MENU)
 
-    while True:
-        race_choice = input(f"Enter choice (1-{len(race_list)}): ")
-        try:
-            choice_num = int(race_choice)
-            if 1 <= choice_num <= len(race_list):
-                race = race_list[choice_num - 1]
-                break
-            else:
-                print(f"Please enter a number between 1 and {len(race_list)}.")
-        except ValueError:
-            print("Please enter a valid number.")
+    while (race := _RACE_BY_KEY.get(_read(_RACE_PROMPT).strip())) is None:
+        print(f"Please enter a number between 1 and {len(_RACE_LIST)}.")
     print("\n")
 
     # Weapon selection
     print("Choose your weapon:")
-    weapon_list = list(WEAPONS.keys())
-    weapon_menu_items = [
-        f"{i}. {WEAPONS[weapon_name]}"
-        for i, weapon_name in enumerate(weapon_list, start=1)
-    ]
-    print("\n".join(weapon_menu_items))
+    print(_WEAPON_MENU)
 
-    while True:
-        weapon_choice = input(f"Enter choice (1-{len(weapon_list)}): ")
-        try:
-            choice_num = int(weapon_choice)
-            if 1 <= choice_num <= len(weapon_list):
-                weapon_name = weapon_list[choice_num - 1]
-                weapon = WEAPONS[weapon_name]
-                break
-            else:
-                print(f"Please enter a number between 1 and {len(weapon_list)}.")
-        except ValueError:
-            print("Please enter a valid number.")
+    while (weapon := _WEAPON_BY_KEY.get(_read(_WEAPON_PROMPT).strip())) is None:
+        print(f"Please enter a number between 1 and {len(_WEAPON_LIST)}.")
     print("\n")
 
     character = Character(name, race, 10)
@@ -77,41 +170,26 @@ def create_character() -> Character:
     print("1. Yes, I want to be a spellcaster")
     print("2. No, I'll stick to weapons")
 
-    while True:
-        spell_choice = input("Enter choice (1-2): ").strip()
-        if spell_choice in ("1", "2"):
-            break
+    while (spell_choice := _read("Enter choice (1-2): ").strip()) not in _YES_NO_CHOICES:
         print("Please enter 1 or 2.")
 
     if spell_choice == "1":
         print("\nChoose 3 spells to learn:")
-        spell_list = list(SPELLS.keys())
-        spell_menu_items = [
-            f"{i}. {SPELLS[spell_name]}"
-            for i, spell_name in enumerate(spell_list, 1)
-        ]
-        print("\n".join(spell_menu_items))
-
-        chosen_spells = []
+        print(_SPELL_MENU)
+
+        chosen_spells: Set[Spell] = set()
         while len(chosen_spells) < 3:
-            spell_idx_input = input(
-                f"Choose spell {len(chosen_spells) + 1} (1-{len(spell_list)}): "
+            spell = _SPELL_BY_KEY.get(
+                _read(f"Choose spell {len(chosen_spells) + 1} (1-{len(_SPELL_LIST)}): ").strip()
             )
-            try:
-                spell_idx = int(spell_idx_input)
-                if 1 <= spell_idx <= len(spell_list):
-                    spell_name = spell_list[spell_idx - 1]
-                    spell = SPELLS[spell_name]
-                    if spell in chosen_spells:
-                        print("You already chose that spell. Pick a different one.")
-                    else:
-                        chosen_spells.append(spell)
-                        character.add_spell(spell)
-                        print(f"Learned {spell.name}!")
-                else:
-                    print(f"Please enter a number between 1 and {len(spell_list)}.")
-            except ValueError:
-                print("Please enter a valid number.")
+            if spell is None:
+                print(f"Please enter a number between 1 and {len(_SPELL_LIST)}.")
+            elif spell in chosen_spells:
+                print("You already chose that spell. Pick a different one.")
+            else:
+                chosen_spells.add(spell)
+                character.add_spell(spell)
+                print(f"Learned {spell.name}!")
 
     print("\n")
     return character
@@ -137,13 +215,10 @@ def display_character(character: Character) -> None:
         print(f"XP: {character.xp} (Max Level)")
 
     print("\nStats:")
-    # Generate stat lines using list comprehension with modifiers calculated once
+    # Modifiers come from the character's cache in one call
+    modifiers = character.get_modifiers()
     stat_lines = [
-        f"{stat}: {value} ({'+' if modifier >= 0 else ''}{modifier})"
-        for stat, value, modifier in (
-            (stat, value, character.get_modifier(stat))
-            for stat, value in character.stats.items()
-        )
+        f"{stat}: {value} ({modifiers[stat]:+d})" for stat, value in character.stats.items()
     ]
     print("\n".join(stat_lines))
     print(f"\nHP: {character.hp}/{character.max_hp}")
@@ -155,74 +230,64 @@ def display_character(character: Character) -> None:
             level_str = "Cantrip" if spell.level == 0 else f"Level {spell.level}"
             print(f"  - {spell.name} ({level_str})")
         print("\nSpell Slots:")
-        for level in sorted(character.spell_slots.keys()):
-            if character.max_spell_slots[level] > 0:
-                print(
-                    f"  Level {level}: {character.spell_slots[level]}/{character.max_spell_slots[level]}"
-                )
+        for level in _SPELL_LEVEL_ORDER:
+            max_slots = character.max_spell_slots.get(level, 0)
+            if max_slots:
+                print(f"  Level {level}: {character.spell_slots[level]}/{max_slots}")
 
 
-def start_combat(player: Character, dm: DungeonMaster) -> bool:
+async def start_combat(
+    player: Character, dm: DungeonMaster, narrations: NarrationPrinter
+) -> bool:
     """Start a combat encounter with a goblin using the Combat class.
 
     Uses the Combat class to manage combat rounds. The goblin attacks the player
     each round. Combat continues until either the player or goblin reaches 0 HP,
     or the player chooses to run away.
 
+    Attack and spell narrations are submitted to the printer as soon as the
+    damage is known and are printed before the next prompt, so their API
+    requests overlap with the rest of the round.
+
     Args:
         player: The player's Character instance.
         dm: The DungeonMaster instance for narration.
+        narrations: The printer that prints narrations in order.
 
     Returns:
         True if the goblin was defeated, False if the player ran away or was defeated.
     """
-    # Create goblin enemy with appropriate stats
-    goblin_stats = {
-        "STR": 8,
-        "DEX": 14,
-        "CON": 10,
-        "INT": 10,
-        "WIS": 8,
-        "CHA": 8,
-    }
-    goblin = Enemy(
-        "Goblin", goblin_stats, hp=5, armor_class=10, weapon=WEAPONS["Shortsword"], xp_value=50
-    )
+    goblin = _GOBLIN.clone()
 
     print(f"\nA {goblin.name} appears!")
 
-    # DM narrates the combat start
-    narration = dm.narrate_combat_start(player.name, goblin.name)
-    if narration:
-        print(f"\n🎲 {narration}\n")
+    # DM narrates the combat start, printed as it streams in
+    if await dm.narrate_combat_start(player.name, goblin.name, stream=True):
+        print()
 
     combat = Combat(player, goblin)
     combat.roll_initiative()
 
     while player.is_alive() and goblin.is_alive():
-        print(f"\n--- Round {combat.round + 1} ---")
-        print(f"{player.name} HP: {player.hp}/{player.max_hp}")
-        print(f"{goblin.name} HP: {goblin.hp}/{goblin.max_hp}")
-
-        # Player's turn
-        print("\nYour turn!")
+        # Print last round's narrations before asking for the next move
+        await narrations.flush()
+
+        # Round header and the start of the player's turn in one write
+        sys.stdout.write(
+            f"\n--- Round {combat.round + 1} ---\n"
+            f"{player.name} HP: {player.hp}/{player.max_hp}\n"
+            f"{goblin.name} HP: {goblin.hp}/{goblin.max_hp}\n"
+            "\nYour turn!\n"
+        )
 
-        # DM narrates player's turn
-        narration = dm.narrate_action_choice(
-            player.name, ["attack with your weapon", "cast a spell", "run away"]
+        # DM narrates player's turn, printed as it streams in
+        await dm.narrate_action_choice(
+            player.name, ["attack with your weapon", "cast a spell", "run away"], stream=True
         )
-        if narration:
-            print(f"🎲 {narration}")
 
-        print("\n1. Attack with weapon")
-        print("2. Cast spell")
-        print("3. Run away")
-        print()
+        sys.stdout.write(_COMBAT_MENU)
 
-        while True:
-            choice = input("What do you do? ").strip()
-            if choice in ("1", "2", "3"):
-                break
+        while (choice := _read("What do you do? ").strip()) not in _COMBAT_CHOICES:
             print("Please enter 1, 2, or 3.")
 
         if choice == "3":
@@ -238,15 +303,15 @@ def start_combat(player: Character, dm: DungeonMaster) -> bool:
                 print("You missed!")
 
             # DM narrates the attack
-            narration = dm.narrate_attack(
-                player.name,
-                goblin.name,
-                player.weapon.name if player.weapon else "fists",
-                damage,
-                damage > 0,
+            await narrations.submit(
+                dm.narrate_attack(
+                    player.name,
+                    goblin.name,
+                    player.weapon.name if player.weapon else "fists",
+                    damage,
+                    damage > 0,
+                )
             )
-            if narration:
-                print(f"🎲 {narration}")
         elif choice == "2":
             # Cast spell
             available_spells = player.get_available_spells()
@@ -259,55 +324,44 @@ def start_combat(player: Character, dm: DungeonMaster) -> bool:
                 else:
                     print("You missed!")
             else:
-                print("\nAvailable spells:")
-                for i, spell in enumerate(available_spells, 1):
-                    slots_info = ""
-                    if spell.level > 0:
-                        slots_info = f" (Slots: {player.spell_slots[spell.level]}/{player.max_spell_slots[spell.level]})"
-                    print(f"{i}. {spell.name} - Level {spell.level}{slots_info}")
+                sys.stdout.write(f"\nAvailable spells:\n{player.render_spell_menu()}\n")
 
+                spell_by_key = {str(i): spell for i, spell in enumerate(available_spells, 1)}
                 while True:
-                    spell_choice = input(f"Choose spell (1-{len(available_spells)}) or 0 to cancel: ").strip()
-                    try:
-                        spell_idx = int(spell_choice)
-                        if spell_idx == 0:
-                            # Use weapon attack instead
-                            damage = combat.attack(player, goblin)
-                            if damage > 0:
-                                print(f"You hit the {goblin.name} for {damage} damage!")
-                            else:
-                                print("You missed!")
-                            break
-                        if 1 <= spell_idx <= len(available_spells):
-                            spell = available_spells[spell_idx - 1]
-                            damage = player.cast_spell(spell, goblin)
-                            if damage > 0:
-                                print(f"You cast {spell.name} and deal {damage} damage!")
-                            elif damage < 0:
-                                print(f"You cast {spell.name} and heal for {-damage} HP!")
-                            else:
-                                print(f"You cast {spell.name}!")
-
-                            # DM narrates the spell
-                            narration = dm.narrate_spell_cast(
-                                player.name, goblin.name, spell.name, damage
-                            )
-                            if narration:
-                                print(f"🎲 {narration}")
-                            break
+                    spell_choice = _read(f"Choose spell (1-{len(available_spells)}) or 0 to cancel: ").strip()
+                    if spell_choice == "0":
+                        # Use weapon attack instead
+                        damage = combat.attack(player, goblin)
+                        if damage > 0:
+                            print(f"You hit the {goblin.name} for {damage} damage!")
                         else:
-                            print(f"Please enter a number between 0 and {len(available_spells)}.")
-                    except ValueError:
-                        print("Please enter a valid number.")
+                            print("You missed!")
+                        break
+                    chosen_spell = spell_by_key.get(spell_choice)
+                    if chosen_spell is None:
+                        print(f"Please enter a number between 0 and {len(available_spells)}.")
+                        continue
+
+                    damage = player.cast_spell(chosen_spell, goblin)
+                    if damage > 0:
+                        print(f"You cast {chosen_spell.name} and deal {damage} damage!")
+                    elif damage < 0:
+                        print(f"You cast {chosen_spell.name} and heal for {-damage} HP!")
+                    else:
+                        print(f"You cast {chosen_spell.name}!")
+
+                    # DM narrates the spell
+                    await narrations.submit(
+                        dm.narrate_spell_cast(player.name, goblin.name, chosen_spell.name, damage)
+                    )
+                    break
 
         # Check if goblin is defeated
         if not goblin.is_alive():
             print(f"You defeated the {goblin.name}!")
-
-            # DM narrates the victory
-            narration = dm.narrate_victory(player.name, goblin.name)
-            if narration:
-                print(f"🎲 {narration}")
+            # DM narrates the victory alongside the final action
+            await narrations.submit(dm.narrate_victory(player.name, goblin.name))
+            await narrations.flush()
 
             player.gain_xp(goblin.xp_value)
             return True
@@ -322,25 +376,22 @@ def start_combat(player: Character, dm: DungeonMaster) -> bool:
                 print(f"The {goblin.name} missed!")
 
             # DM narrates the goblin's attack
-            narration = dm.narrate_attack(
-                goblin.name,
-                player.name,
-                goblin.weapon.name if goblin.weapon else "claws",
-                damage,
-                damage > 0,
+            await narrations.submit(
+                dm.narrate_attack(
+                    goblin.name,
+                    player.name,
+                    goblin.weapon.name if goblin.weapon else "claws",
+                    damage,
+                    damage > 0,
+                )
             )
-            if narration:
-                print(f"🎲 {narration}")
 
             # Check if player is defeated
             if not player.is_alive():
                 print("\nYou have been defeated! Your HP reached 0.")
-
-                # DM narrates the defeat
-                narration = dm.narrate_defeat(player.name, goblin.name)
-                if narration:
-                    print(f"🎲 {narration}")
-
+                # DM narrates the defeat alongside the final attack
+                await narrations.submit(dm.narrate_defeat(player.name, goblin.name))
+                await narrations.flush()
                 return False
 
         combat.round += 1
@@ -351,12 +402,14 @@ def start_combat(player: Character, dm: DungeonMaster) -> bool:
     return True
 
 
-def main() -> None:
+async def main() -> None:
     """Main game loop for the D&D Adventure game.
 
     Creates a character and presents a menu allowing the player to fight goblins,
     view their character stats, or quit the game.
     """
+    # Show dice rolls and level-up messages during interactive play
+    log.VERBOSE = True
     player = create_character()
 
     # Ask if player wants DM narration
@@ -364,47 +417,49 @@ def main() -> None:
     print("1. Yes, enable DM narration")
     print("2. No, play without narration")
 
-    while True:
-        dm_choice = input("Enter choice (1-2): ").strip()
-        if dm_choice in ("1", "2"):
-            break
+    while (dm_choice := _read("Enter choice (1-2): ").strip()) not in _YES_NO_CHOICES:
         print("Please enter 1 or 2.")
 
     dm = DungeonMaster(enabled=(dm_choice == "1"))
+    narrations = NarrationPrinter()
 
-    while True:
-        print("\nWhat would you like to do?")
-        print("1. Fight a goblin")
-        print("2. View character")
-        print("3. Rest (restore HP and spell slots)")
-        print("4. Quit")
-
+    # Always stop the printer and the DM client, even if input runs out mid-game
+    try:
         while True:
-            choice = input("Enter choice (1-4): ").strip()
-            if choice in ("1", "2", "3", "4"):
-                break
-            print("Please enter 1, 2, 3, or 4.")
-
-        if choice == "1":
-            victory = start_combat(player, dm)
-            if victory:
-                print("Victory!")
-            elif not player.is_alive():
-                print("You have been defeated!")
+            print("\nWhat would you like to do?")
+            print("1. Fight a goblin")
+            print("2. View character")
+            print("3. Rest (restore HP and spell slots)")
+            print("4. Quit")
+
+            while (choice := _read("Enter choice (1-4): ").strip()) not in _MAIN_CHOICES:
+                print("Please enter 1, 2, 3, or 4.")
+
+            if choice == "1":
+                victory = await start_combat(player, dm, narrations)
+                if victory:
+                    print("Victory!")
+                elif not player.is_alive():
+                    print("You have been defeated!")
+                    break
+                else:
+                    print("You ran away!")
+            elif choice == "2":
+                display_character(player)
+            elif choice == "3":
+                player.rest()
+                print("You take a rest and feel refreshed!")
+                print(f"HP restored to {player.hp}/{player.max_hp}")
+                if player.known_spells:
+                    print("All spell slots restored!")
+            elif choice == "4":
                 break
-            else:
-                print("You ran away!")
-        elif choice == "2":
-            display_character(player)
-        elif choice == "3":
-            player.rest()
-            print("You take a rest and feel refreshed!")
-            print(f"HP restored to {player.hp}/{player.max_hp}")
-            if player.known_spells:
-                print("All spell slots restored!")
-        elif choice == "4":
-            break
+    finally:
+        try:
+            await narrations.close()
+        finally:
+            await dm.close()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,191 @@
+"""Pre-generate attack and spell narrations with OpenAI's Batch API.
+
+The set of weapon attacks and spell casts is small enough to enumerate,
+so their narrations can be generated offline at Batch API prices and then
+served from a local file with no latency during play. Names are left as
+placeholders and filled in by the DungeonMaster at runtime.
+
+Usage (from the project root):
+    python -m scripts.pregenerate_narrations submit
+    python -m scripts.pregenerate_narrations collect <batch_id>
+
+`submit` uploads the requests and prints the batch ID. Once the batch has
+completed (within 24 hours), `collect` downloads the results and writes
+them to dndgame/narrations.json, where DungeonMaster picks them up.
+"""
+
+import argparse
+import io
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from dotenv import load_dotenv
+from openai import OpenAI
+
+from dndgame.dungeon_master import (
+    ATTACKER_PLACEHOLDER,
+    DEFENDER_PLACEHOLDER,
+    NARRATION_CORPUS_PATH,
+    NARRATION_VARIANTS,
+    SYSTEM_PROMPT,
+    DungeonMaster,
+    corpus_key,
+    spell_effect,
+)
+from dndgame.spells import SPELLS
+from dndgame.weapons import WEAPONS
+
+MODEL = "gpt-4o-mini"
+
+# Range of INT modifiers (scores 3-20) that can shift spell damage
+INT_MODIFIER_RANGE = range(-4, 6)
+
+PLACEHOLDER_NOTE = (
+    f"Refer to the attacker only as {ATTACKER_PLACEHOLDER} and the target only as "
+    f"{DEFENDER_PLACEHOLDER}, written exactly like that."
+)
+
+
+def iter_events() -> Iterator[Tuple[str, str, Dict[str, object]]]:
+    """Enumerate every narration event worth pre-generating.
+
+    Yields:
+        Tuples of (corpus key, DungeonMaster template key, template fields),
+        with the names left as placeholders.
+    """
+    names = {"attacker": ATTACKER_PLACEHOLDER, "defender": DEFENDER_PLACEHOLDER}
+    for weapon in WEAPONS.values():
+        yield corpus_key("attack", weapon.name, "miss", 0), "attack_miss", {
+            **names,
+            "weapon": weapon.name,
+        }
+        max_damage = weapon.damage_die * weapon.damage_dice_count
+        for damage in range(weapon.damage_dice_count, max_damage + 1):
+            yield corpus_key("attack", weapon.name, "hit", damage), "attack_hit", {
+                **names,
+                "weapon": weapon.name,
+                "damage": damage,
+            }
+
+    for spell in SPELLS.values():
+        damages = sorted(
+            {max(0, spell.spell_power + mod) for mod in INT_MODIFIER_RANGE}
+        )
+        for damage in damages:
+            yield corpus_key("spell", spell.name, damage), "spell_cast", {
+                "caster": ATTACKER_PLACEHOLDER,
+                "target": DEFENDER_PLACEHOLDER,
+                "spell": spell.name,
+                "effect": spell_effect(damage),
+            }
+
+
+def build_requests(model: str = MODEL) -> List[Dict[str, Any]]:
+    """Build one Batch API request per event variant.
+
+    Prompts, max_tokens and temperature come from the DungeonMaster's own
+    templates, so the corpus matches what live narration would ask for.
+
+    Args:
+        model: The OpenAI model to generate with.
+
+    Returns:
+        The request objects to write as JSONL.
+    """
+    requests: List[Dict[str, Any]] = []
+    for key, template_key, fields in iter_events():
+        prompt, max_tokens, temperature = DungeonMaster.prompt(template_key, **fields)
+        body = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": f"{prompt} {PLACEHOLDER_NOTE}"},
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        requests.extend(
+            {
+                "custom_id": f"{key}#{variant}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }
+            for variant in range(NARRATION_VARIANTS)
+        )
+    return requests
+
+
+def parse_results(output: str) -> Dict[str, List[str]]:
+    """Group Batch API output lines into a narration corpus.
+
+    Args:
+        output: The contents of the batch output file (JSONL).
+
+    Returns:
+        A mapping of corpus key to its generated narrations.
+    """
+    corpus: Dict[str, List[str]] = defaultdict(list)
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        key = result["custom_id"].rsplit("#", 1)[0]
+        content = response["body"]["choices"][0]["message"]["content"]
+        if content:
+            corpus[key].append(content.strip())
+    return dict(corpus)
+
+
+def submit(client: OpenAI) -> None:
+    """Upload the requests and start a batch."""
+    requests = build_requests()
+    payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+    batch_file = client.files.create(
+        file=("narrations.jsonl", io.BytesIO(payload)), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    print(f"Submitted {len(requests)} requests as batch {batch.id}")
+
+
+def collect(client: OpenAI, batch_id: str, output_path: Path) -> None:
+    """Download a finished batch and write the narration corpus."""
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed" or not batch.output_file_id:
+        print(f"Batch {batch_id} is {batch.status}; try again later.")
+        return
+    corpus = parse_results(client.files.content(batch.output_file_id).text)
+    with open(output_path, "w", encoding="utf-8") as corpus_file:
+        json.dump(corpus, corpus_file, indent=2, sort_keys=True)
+    print(f"Wrote {len(corpus)} events to {output_path}")
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("submit", help="upload requests and start a batch")
+    collect_parser = commands.add_parser("collect", help="download a finished batch")
+    collect_parser.add_argument("batch_id")
+    collect_parser.add_argument("--output", type=Path, default=NARRATION_CORPUS_PATH)
+    args = parser.parse_args()
+
+    load_dotenv()
+    client = OpenAI()
+    if args.command == "submit":
+        submit(client)
+    else:
+        collect(client, args.batch_id, args.output)
+
+
+if __name__ == "__main__":
+    main()
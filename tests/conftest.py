@@ -0,0 +1,82 @@
+"""Shared pytest fixtures."""
+
+import random
+
+import pytest
+
+from dndgame import dice, log
+from dndgame.character import Character, Enemy
+from tests.helpers import stats_with
+
+
+class RollSource:
+    """Stand-in generator that replays random draws made up front.
+
+    Install it with dice.set_rng() so a test's rolls come from one seeded
+    batch instead of the shared random state.
+    """
+
+    def __init__(self, seed, n):
+        rng = random.Random(seed)
+        self._draws = iter([rng.random() for _ in range(n)])
+
+    def randint(self, a, b):
+        """Return the next pre-drawn value scaled to the range [a, b]."""
+        return a + int(next(self._draws) * (b - a + 1))
+
+
+class MaxRolls:
+    """Stand-in generator whose every die lands on its highest face."""
+
+    def randint(self, a, b):
+        """Return b, the top of the range."""
+        return b
+
+
+@pytest.fixture(autouse=True)
+def _seed_random():
+    """Seed the shared random state so every test rolls the same dice on every run."""
+    random.seed(0)
+    yield
+
+
+@pytest.fixture
+def verbose(monkeypatch):
+    """Enable game output for tests that check what gets printed."""
+    monkeypatch.setattr(log, "VERBOSE", True)
+
+
+@pytest.fixture(scope="module")
+def attacker_template():
+    """An unarmed attacker with all-10 stats, built once per test module."""
+    attacker = Character.blank()
+    attacker.name = "Attacker"
+    attacker.stats = stats_with()
+    return attacker
+
+
+@pytest.fixture(scope="module")
+def defender_template():
+    """An all-10 enemy with 20 HP and AC 10, built once per test module."""
+    return Enemy("Defender", stats_with(), hp=20, armor_class=10)
+
+
+@pytest.fixture
+def roll_source():
+    """Install a RollSource for the test's dice; call it with a seed and a draw count."""
+
+    def install(seed=0, n=100):
+        source = RollSource(seed, n)
+        dice.set_rng(source)
+        return source
+
+    yield install
+    dice.set_rng(None)
+
+
+@pytest.fixture
+def max_rolls():
+    """Make every die roll its maximum, so every attack hits for full damage."""
+    dice.set_rng(MaxRolls())
+    yield
+    dice.set_rng(None)
@@ -0,0 +1,40 @@
+"""Plain helpers for building test entities, imported by the test modules."""
+
+import copy
+from functools import lru_cache
+from types import MappingProxyType
+
+from dndgame.character import Character
+
+# Read-only all-10 ability scores; use stats_with() for a mutable copy
+STATS_10 = MappingProxyType(
+    {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+)
+
+
+def stats_with(**overrides):
+    """Return a fresh stats dictionary of all 10s with the given scores replaced."""
+    return {**STATS_10, **overrides}
+
+
+@lru_cache(maxsize=8)
+def _proto(name, race, base_hp):
+    """Build one prototype Character per argument set; never use it directly."""
+    return Character(name, race, base_hp)
+
+
+def fresh_char(name, race, base_hp):
+    """Return a new Character, copied from a cached prototype instead of built."""
+    return copy.copy(_proto(name, race, base_hp))
+
+
+def copy_with_stats(template, **stats):
+    """Return a copy of a template entity with the given stats replaced.
+
+    Characters copy their own spells and spell slots too; other entities
+    share everything but their stats with the template, so tests should
+    only change their stats, HP, armor class and weapon.
+    """
+    entity = copy.copy(template)
+    entity.stats = {**template.stats, **stats}
+    return entity
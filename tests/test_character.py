@@ -1,9 +1,12 @@
 """Comprehensive tests for the character module."""
 
+import copy
+
 import pytest
 from dndgame.character import Character, Enemy, Entity, RACES
 from dndgame.weapons import WEAPONS
 from dndgame.spells import Spell
+from tests.helpers import fresh_char, stats_with
 
 
 class TestEntity:
@@ -11,7 +14,7 @@ class TestEntity:
 
     def test_entity_creation(self):
         """Test basic entity creation."""
-        stats = {"STR": 10, "DEX": 12, "CON": 14, "INT": 8, "WIS": 10, "CHA": 10}
+        stats = stats_with(DEX=12, CON=14, INT=8)
         entity = Entity("TestEntity", stats, hp=20, armor_class=15)
 
         assert entity.name == "TestEntity"
@@ -22,7 +25,7 @@ class TestEntity:
 
     def test_entity_default_weapon(self):
         """Test that entity gets default weapon if none provided."""
-        stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        stats = stats_with()
         entity = Entity("TestEntity", stats, hp=10)
 
         assert entity.weapon is not None
@@ -30,7 +33,7 @@ class TestEntity:
 
     def test_entity_custom_weapon(self):
         """Test entity creation with custom weapon."""
-        stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        stats = stats_with()
         entity = Entity("TestEntity", stats, hp=10, weapon=WEAPONS["Longsword"])
 
         assert entity.weapon.name == "Longsword"
@@ -56,7 +59,7 @@ class TestEntity:
 
     def test_is_alive(self):
         """Test is_alive method."""
-        stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        stats = stats_with()
         entity = Entity("TestEntity", stats, hp=10)
 
         assert entity.is_alive() is True
@@ -70,6 +73,56 @@ class TestEntity:
         entity.hp = -5
         assert entity.is_alive() is False
 
+    def test_get_modifier_follows_stat_changes(self):
+        """Test that cached modifiers are refreshed when stats are replaced."""
+        stats = stats_with()
+        entity = Entity("TestEntity", stats, hp=10)
+        assert entity.get_modifier("STR") == 0
+
+        entity.stats = stats_with(STR=18)
+        assert entity.get_modifier("STR") == 4
+
+    def test_set_stat_refreshes_modifier(self):
+        """Test that single stat changes go through set_stat and update modifiers."""
+        entity = Entity("TestEntity", stats_with(STR=14), hp=10)
+        assert entity.get_modifier("STR") == 2
+
+        with pytest.raises(TypeError):
+            entity.stats["STR"] = 20
+
+        entity.set_stat("STR", 20)
+        assert entity.stats["STR"] == 20
+        assert entity.get_modifier("STR") == 5
+
+    def test_stats_are_copied_on_assignment(self):
+        """Test that changing the assigned dictionary does not change the entity."""
+        stats = stats_with()
+        entity = Entity("TestEntity", stats, hp=10)
+
+        stats["STR"] = 20
+        assert entity.stats["STR"] == 10
+        assert entity.get_modifier("STR") == 0
+
+    def test_get_modifiers(self):
+        """Test that all modifiers are returned as an independent copy."""
+        stats = stats_with(STR=18, DEX=3, CON=11, WIS=9, CHA=20)
+        entity = Entity("TestEntity", stats, hp=10)
+
+        modifiers = entity.get_modifiers()
+        assert modifiers == {"STR": 4, "DEX": -4, "CON": 0, "INT": 0, "WIS": -1, "CHA": 5}
+
+        modifiers["STR"] = 0
+        assert entity.get_modifier("STR") == 4
+
+    def test_entity_uses_slots(self):
+        """Test that entities have no per-instance __dict__."""
+        stats = stats_with()
+        entity = Entity("TestEntity", stats, hp=10)
+
+        assert not hasattr(entity, "__dict__")
+        with pytest.raises(AttributeError):
+            entity.mana = 5
+
 
 class TestCharacter:
     """Tests for the Character class."""
@@ -85,9 +138,47 @@ class TestCharacter:
         assert character.xp == 0
         assert character.known_spells == []
 
-    def test_roll_stats(self, capsys):
+    def test_blank(self):
+        """Test that a blank character is a usable level 1 character."""
+        character = Character.blank()
+        character.name = "Blank"
+        character.stats = stats_with(INT=16)
+
+        assert character.level == 1
+        assert character.xp == 0
+        assert character.weapon is None
+        assert character.get_modifier("INT") == 3
+        assert character.spell_slots == character.max_spell_slots == {1: 2, 2: 0, 3: 0}
+        assert character.spell_slots is not character.max_spell_slots
+
+        cantrip = Spell("Fire Bolt", 0, "Evocation", 5)
+        character.add_spell(cantrip)
+        assert character.render_spell_menu() == "1. Fire Bolt - Level 0"
+
+        # Each blank character starts fresh, whatever earlier ones were given
+        other = Character.blank()
+        assert (other.name, dict(other.stats), other.known_spells) == ("", {}, [])
+        assert other.spell_slots == {1: 2, 2: 0, 3: 0}
+
+    def test_copy(self):
+        """Test that a copied character shares no mutable state with the original."""
+        original = Character("TestChar", "Human", 10)
+        original.stats = stats_with(STR=16)
+        original.add_spell(Spell("Magic Missile", 1, "Evocation", 7))
+
+        clone = copy.copy(original)
+        clone.set_stat("STR", 8)
+        clone.add_spell(Spell("Shield", 1, "Abjuration", 0))
+        clone.spell_slots[1] = 0
+
+        assert clone.name == "TestChar" and clone.weapon is original.weapon
+        assert original.stats["STR"] == 16
+        assert [spell.name for spell in original.known_spells] == ["Magic Missile"]
+        assert original.spell_slots[1] == 2
+
+    def test_roll_stats(self, capsys, verbose):
         """Test stat rolling."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         character.roll_stats()
 
         # Check that all stats are present
@@ -110,39 +201,38 @@ class TestCharacter:
         captured = capsys.readouterr()
         assert "Rolling stats..." in captured.out
 
-    def test_apply_racial_bonuses_human(self):
-        """Test applying Human racial bonuses."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    @pytest.mark.parametrize(
+        "race, expected",
+        [
+            ("Human", stats_with(STR=11, DEX=11, CON=11, INT=11, WIS=11, CHA=11)),
+            ("Elf", {"DEX": 12, "STR": 10}),
+            ("Orc", {"STR": 12, "CON": 11, "INT": 9}),
+        ],
+    )
+    def test_apply_racial_bonuses(self, race, expected):
+        """Test applying racial bonuses, including negative ones."""
+        character = fresh_char("TestChar", race, 10)
+        character.stats = stats_with()
         character.apply_racial_bonuses()
 
-        # Humans get +1 to all stats
-        assert all(value == 11 for value in character.stats.values())
+        for stat, value in expected.items():
+            assert character.stats[stat] == value
+        # Modifiers must follow the adjusted stats
+        for stat in expected:
+            assert character.get_modifier(stat) == (character.stats[stat] - 10) // 2
 
-    def test_apply_racial_bonuses_elf(self):
-        """Test applying Elf racial bonuses."""
-        character = Character("TestChar", "Elf", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+    def test_apply_racial_bonuses_skips_missing_stats(self):
+        """Test that bonuses for stats the character lacks are left out."""
+        character = fresh_char("TestChar", "Orc", 10)
+        character.stats = {"STR": 10}
         character.apply_racial_bonuses()
 
-        # Elves get +2 to DEX only
-        assert character.stats["DEX"] == 12
-        assert character.stats["STR"] == 10
-
-    def test_apply_racial_bonuses_orc(self):
-        """Test applying Orc racial bonuses (including negative)."""
-        character = Character("TestChar", "Orc", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        character.apply_racial_bonuses()
-
-        # Orcs get +2 STR, +1 CON, -1 INT
-        assert character.stats["STR"] == 12
-        assert character.stats["CON"] == 11
-        assert character.stats["INT"] == 9
+        assert dict(character.stats) == {"STR": 12}
+        assert character.get_modifiers() == {"STR": 1}
 
     def test_add_spell(self):
         """Test adding spells to character."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         spell = Spell("Fireball", 3, "Evocation", 15)
 
         character.add_spell(spell)
@@ -155,14 +245,14 @@ class TestCharacter:
 
     def test_can_cast_spell_unknown_spell(self):
         """Test that character cannot cast unknown spells."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         spell = Spell("Fireball", 3, "Evocation", 15)
 
         assert character.can_cast_spell(spell) is False
 
     def test_can_cast_spell_cantrip(self):
         """Test that cantrips can always be cast."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         cantrip = Spell("Fire Bolt", 0, "Evocation", 5)
 
         character.add_spell(cantrip)
@@ -174,7 +264,7 @@ class TestCharacter:
 
     def test_can_cast_spell_with_slots(self):
         """Test casting spells with available slots."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         spell = Spell("Magic Missile", 1, "Evocation", 7)
 
         character.add_spell(spell)
@@ -182,7 +272,7 @@ class TestCharacter:
 
     def test_can_cast_spell_no_slots(self):
         """Test that spell cannot be cast without slots."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         spell = Spell("Magic Missile", 1, "Evocation", 7)
 
         character.add_spell(spell)
@@ -193,13 +283,13 @@ class TestCharacter:
 
     def test_cast_spell(self):
         """Test spell casting mechanics."""
-        caster = Character("Wizard", "Human", 10)
-        caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 16, "WIS": 10, "CHA": 10}
+        caster = fresh_char("Wizard", "Human", 10)
+        caster.stats = stats_with(INT=16)
         caster.hp = 20
         caster.max_hp = 20
 
-        target = Character("Target", "Human", 10)
-        target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        target = fresh_char("Target", "Human", 10)
+        target.stats = stats_with()
         target.hp = 20
         target.max_hp = 20
 
@@ -218,11 +308,11 @@ class TestCharacter:
 
     def test_cast_spell_cantrip_no_slot_consumption(self):
         """Test that casting cantrips doesn't consume slots."""
-        caster = Character("Wizard", "Human", 10)
-        caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 14, "WIS": 10, "CHA": 10}
+        caster = fresh_char("Wizard", "Human", 10)
+        caster.stats = stats_with(INT=14)
 
-        target = Character("Target", "Human", 10)
-        target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        target = fresh_char("Target", "Human", 10)
+        target.stats = stats_with()
         target.hp = 20
         target.max_hp = 20
 
@@ -238,9 +328,9 @@ class TestCharacter:
 
     def test_cast_spell_raises_error_if_cannot_cast(self):
         """Test that casting unavailable spell raises error."""
-        caster = Character("Wizard", "Human", 10)
-        target = Character("Target", "Human", 10)
-        target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        caster = fresh_char("Wizard", "Human", 10)
+        target = fresh_char("Target", "Human", 10)
+        target.stats = stats_with()
 
         spell = Spell("Magic Missile", 1, "Evocation", 7)
 
@@ -249,8 +339,8 @@ class TestCharacter:
 
     def test_rest(self):
         """Test rest restores HP and spell slots."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.hp = 20
         character.max_hp = 20
 
@@ -265,7 +355,7 @@ class TestCharacter:
 
     def test_get_available_spells(self):
         """Test getting list of castable spells."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
 
         spell1 = Spell("Fire Bolt", 0, "Evocation", 5)  # Cantrip - always available
         spell2 = Spell("Magic Missile", 1, "Evocation", 7)  # Has slots
@@ -281,26 +371,49 @@ class TestCharacter:
         assert spell2 in available  # Has level 1 slots
         assert spell3 not in available  # No level 3 slots at level 1
 
+    def test_render_spell_menu(self):
+        """Test the spell menu is cached until slots or spells change."""
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
+        character.add_spell(Spell("Fire Bolt", 0, "Evocation", 5))
+        character.add_spell(Spell("Magic Missile", 1, "Evocation", 7))
+
+        menu = character.render_spell_menu()
+        assert menu == (
+            "1. Fire Bolt - Level 0\n"
+            "2. Magic Missile - Level 1 (Slots: 2/2)"
+        )
+        assert character.render_spell_menu() is menu
+
+        character.cast_spell(character.known_spells[1], character)
+        assert "(Slots: 1/2)" in character.render_spell_menu()
+
+        character.rest()
+        assert "(Slots: 2/2)" in character.render_spell_menu()
+
+        character.add_spell(Spell("Shield", 1, "Abjuration", 0))
+        assert "3. Shield - Level 1" in character.render_spell_menu()
+
     def test_get_xp_for_next_level(self):
         """Test XP requirement calculation."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
 
         # Level 1 -> 2 requires 300 XP
         assert character.get_xp_for_next_level() == 300
 
     def test_get_xp_for_next_level_max_level(self):
         """Test XP requirement at max level."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.level = 10
 
         assert character.get_xp_for_next_level() == 0
 
-    def test_gain_xp_no_level_up(self, capsys):
+    def test_gain_xp_no_level_up(self, capsys, verbose):
         """Test gaining XP without leveling up."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
 
         leveled_up = character.gain_xp(100)
 
@@ -311,10 +424,10 @@ class TestCharacter:
         captured = capsys.readouterr()
         assert "+100 XP!" in captured.out
 
-    def test_gain_xp_with_level_up(self, capsys):
+    def test_gain_xp_with_level_up(self, capsys, verbose):
         """Test gaining enough XP to level up."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.max_hp = 10
         character.hp = 10
 
@@ -329,8 +442,8 @@ class TestCharacter:
 
     def test_gain_xp_multiple_levels(self, capsys):
         """Test gaining enough XP to level up multiple times."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.max_hp = 10
         character.hp = 10
 
@@ -340,10 +453,10 @@ class TestCharacter:
         assert character.level == 4  # Should jump to level 4
         assert leveled_up is True
 
-    def test_level_up(self, capsys):
+    def test_level_up(self, capsys, verbose):
         """Test level up mechanics."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.max_hp = 10
         character.hp = 10
         initial_max_hp = character.max_hp
@@ -360,8 +473,8 @@ class TestCharacter:
 
     def test_level_up_spell_slots_increase(self):
         """Test that spell slots increase on level up."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.max_hp = 10
         character.hp = 10
 
@@ -373,10 +486,10 @@ class TestCharacter:
         # Level 2 has {1: 3, 2: 0, 3: 0}
         assert character.max_spell_slots[1] == 3
 
-    def test_level_up_ability_score_improvement(self, capsys):
+    def test_level_up_ability_score_improvement(self, capsys, verbose):
         """Test ability score improvement at level 4."""
-        character = Character("TestChar", "Human", 10)
-        character.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        character = fresh_char("TestChar", "Human", 10)
+        character.stats = stats_with()
         character.max_hp = 10
         character.hp = 10
 
@@ -397,7 +510,7 @@ class TestEnemy:
 
     def test_enemy_creation(self):
         """Test basic enemy creation."""
-        stats = {"STR": 12, "DEX": 10, "CON": 14, "INT": 8, "WIS": 10, "CHA": 8}
+        stats = stats_with(STR=12, CON=14, INT=8, CHA=8)
         enemy = Enemy("Goblin", stats, hp=10, armor_class=12, xp_value=50)
 
         assert enemy.name == "Goblin"
@@ -409,23 +522,51 @@ class TestEnemy:
 
     def test_enemy_default_xp_value(self):
         """Test enemy creation with default XP value."""
-        stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
+        stats = stats_with()
         enemy = Enemy("TestEnemy", stats, hp=10)
 
         assert enemy.xp_value == 50
 
     def test_enemy_with_weapon(self):
         """Test enemy creation with weapon."""
-        stats = {"STR": 14, "DEX": 10, "CON": 12, "INT": 8, "WIS": 10, "CHA": 8}
+        stats = stats_with(STR=14, CON=12, INT=8, CHA=8)
         enemy = Enemy("Orc", stats, hp=15, weapon=WEAPONS["Battleaxe"])
 
         assert enemy.weapon.name == "Battleaxe"
 
+    def test_enemy_clone(self):
+        """Test that clones match the template but can be changed independently."""
+        stats = stats_with(STR=8, DEX=14, WIS=8, CHA=8)
+        template = Enemy("Goblin", stats, hp=5, armor_class=10, weapon=WEAPONS["Shortsword"], xp_value=50)
+
+        goblin = template.clone()
+
+        assert isinstance(goblin, Enemy)
+        assert goblin is not template
+        assert (goblin.name, goblin.hp, goblin.max_hp) == ("Goblin", 5, 5)
+        assert (goblin.armor_class, goblin.xp_value) == (10, 50)
+        assert goblin.weapon is template.weapon
+        assert goblin.stats == stats
+        assert goblin.get_modifier("DEX") == 2
+
+        goblin.hp = 0
+        goblin.set_stat("DEX", 18)
+        assert template.hp == 5
+        assert template.stats["DEX"] == 14
+        assert template.get_modifier("DEX") == 2
+
+        # copy.copy() gives the same independent copy as clone()
+        orc = copy.copy(template)
+        orc.set_stat("STR", 18)
+        assert orc.xp_value == 50 and orc.get_modifier("STR") == 4
+        assert template.stats["STR"] == 8
+        assert template.get_modifier("STR") == -1
+
     def test_level_up_minimum_hp_increase(self):
         """Test that HP increase is at least 1 even with very low CON."""
-        character = Character("TestChar", "Human", 10)
+        character = fresh_char("TestChar", "Human", 10)
         # Very low CON to test minimum HP increase
-        character.stats = {"STR": 10, "DEX": 10, "CON": 3, "INT": 10, "WIS": 10, "CHA": 10}  # CON 3 = -4 modifier
+        character.stats = stats_with(CON=3)  # CON 3 = -4 modifier
         character.max_hp = 5
         character.hp = 5
         initial_max_hp = character.max_hp
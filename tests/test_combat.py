@@ -1,247 +1,293 @@
 """Comprehensive tests for the combat module."""
 
+import copy
+
 import pytest
-from dndgame.combat import Combat
-from dndgame.character import Character, Enemy
+from dndgame.combat import Combat, simulate_combats
+from dndgame.character import Enemy
 from dndgame.weapons import WEAPONS
+from tests.helpers import copy_with_stats, fresh_char, stats_with
+
+# Every combat test builds or copies its own entities and seeds its own dice
+pytestmark = pytest.mark.parallel
+
+# Highest damage each weapon can roll
+_WEAPON_MAX = {name: w.damage_die * w.damage_dice_count for name, w in WEAPONS.items()}
+
+# (weapon, name) pairs for the per-weapon attack test, looked up once at import
+_WEAPON_CASES = tuple(
+    (WEAPONS[name], name) for name in ("Dagger", "Longsword", "Greatsword", "Greataxe")
+)
+
+
+@pytest.fixture(scope="module")
+def goblin_fight():
+    """The player and goblin templates for combat_basic, built once per module."""
+    player = fresh_char("TestPlayer", "Human", 10)
+    player.stats = stats_with(STR=14, DEX=12, CON=14)
+    player.max_hp = 15
+    player.hp = 15
+    enemy_stats = stats_with(STR=12, DEX=14, INT=8, WIS=8, CHA=8)
+    enemy = Enemy("Goblin", enemy_stats, hp=10)
+    return player, enemy
+
+
+@pytest.fixture
+def combat_basic(goblin_fight):
+    """A fresh player-versus-goblin Combat between copies of the templates."""
+    player, enemy = goblin_fight
+    return Combat(copy.copy(player), enemy.clone())
+
+
+@pytest.fixture
+def initiative_combats():
+    """Combats where one side has DEX 20 and the other DEX 8, keyed by the fast side."""
+    fast = stats_with(DEX=20)  # High DEX
+    slow = stats_with(DEX=8)  # Low DEX
+    combats = {}
+    for high_side, player_stats, enemy_stats in (("player", fast, slow), ("enemy", slow, fast)):
+        player = fresh_char("TestPlayer", "Human", 10)
+        player.stats = player_stats
+        enemy = Enemy("TestEnemy", enemy_stats, hp=10)
+        combats[high_side] = Combat(player, enemy)
+    return combats
 
 
-class TestCombat:
-    """Tests for the Combat class."""
+@pytest.fixture
+def duel():
+    """An attacker, a low-AC defender with 100 HP and their Combat."""
+    attacker = fresh_char("Attacker", "Human", 10)
+    attacker.stats = stats_with(STR=15)
+    defender_stats = stats_with()
+    defender = Enemy("Defender", defender_stats, hp=100, armor_class=5)  # Low AC for guaranteed hits
+    return attacker, defender, Combat(attacker, defender)
 
-    def test_combat_creation(self):
-        """Test basic combat initialization."""
-        player_stats = {"STR": 14, "DEX": 12, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
-        player = Character("TestPlayer", "Human", 10)
-        player.stats = player_stats
-        player.max_hp = 15
-        player.hp = 15
 
-        enemy_stats = {"STR": 12, "DEX": 14, "CON": 10, "INT": 8, "WIS": 8, "CHA": 8}
-        enemy = Enemy("Goblin", enemy_stats, hp=10)
+def test_combat_invariants(combat_basic):
+    """Test basic combat initialization."""
+    assert combat_basic.player.name == "TestPlayer"
+    assert combat_basic.enemy.name == "Goblin"
+    assert combat_basic.round == 0
+    assert combat_basic.initiative_order == []
 
-        combat = Combat(player, enemy)
 
-        assert combat.player == player
-        assert combat.enemy == enemy
-        assert combat.round == 0
-        assert combat.initiative_order == []
+@pytest.mark.parametrize("high_side, expected_wins", [("player", 5), ("enemy", 4)])
+def test_roll_initiative_high_dex_wins(initiative_combats, roll_source, high_side, expected_wins):
+    """Test that the side with much higher DEX usually goes first."""
+    combat = initiative_combats[high_side]
+    fast = getattr(combat, high_side)
+    roll_source(n=10)
 
-    def test_roll_initiative_player_wins(self):
-        """Test initiative rolling when player wins."""
-        player_stats = {"STR": 10, "DEX": 20, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # High DEX
-        player = Character("TestPlayer", "Human", 10)
-        player.stats = player_stats
+    fast_first_count = sum(combat.roll_initiative()[0] == fast for _ in range(5))
 
-        enemy_stats = {"STR": 10, "DEX": 8, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # Low DEX
-        enemy = Enemy("SlowEnemy", enemy_stats, hp=10)
-
-        combat = Combat(player, enemy)
-        
-        # Run multiple times to account for randomness
-        player_first_count = 0
-        for _ in range(10):
-            initiative_order = combat.roll_initiative()
-            if initiative_order[0] == player:
-                player_first_count += 1
-
-        # With DEX +5 vs -1, player should win most of the time
-        assert player_first_count >= 5  # At least 50% of the time
-
-    def test_roll_initiative_enemy_wins(self):
-        """Test initiative rolling when enemy wins."""
-        player_stats = {"STR": 10, "DEX": 8, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # Low DEX
-        player = Character("TestPlayer", "Human", 10)
-        player.stats = player_stats
+    # With DEX +5 vs -1 the fast side wins most of the seeded rolls
+    assert fast_first_count == expected_wins
+
+
+def test_attack_hit(attacker_template, defender_template, roll_source):
+    """Test successful attack."""
+    attacker = copy_with_stats(attacker_template, STR=20)  # High STR
+    attacker.weapon = WEAPONS["Longsword"]
+
+    defender = copy_with_stats(defender_template)  # Low AC
 
-        enemy_stats = {"STR": 10, "DEX": 20, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # High DEX
-        enemy = Enemy("FastEnemy", enemy_stats, hp=10)
-
-        combat = Combat(player, enemy)
-        
-        # Run multiple times to account for randomness
-        enemy_first_count = 0
-        for _ in range(10):
-            initiative_order = combat.roll_initiative()
-            if initiative_order[0] == enemy:
-                enemy_first_count += 1
-
-        # With DEX -1 vs +5, enemy should win most of the time
-        assert enemy_first_count >= 5  # At least 50% of the time
-
-    def test_attack_hit(self):
-        """Test successful attack."""
-        attacker_stats = {"STR": 20, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # High STR
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-        attacker.weapon = WEAPONS["Longsword"]
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=20, armor_class=10)  # Low AC
-
-        combat = Combat(attacker, defender)
-        
-        # Run multiple attacks
-        total_damage = 0
-        hits = 0
-        for _ in range(20):
-            initial_hp = defender.hp
-            defender.hp = 20  # Reset HP
-            damage = combat.attack(attacker, defender)
-            if damage > 0:
-                hits += 1
-                total_damage += damage
-                assert defender.hp == 20 - damage
-                assert 1 <= damage <= 8  # Longsword is 1d8
-
-        # With STR +5 vs AC 10, should hit most of the time
-        assert hits >= 10  # At least 50% hit rate (AC 10 requires 10+ on d20, modifier gives +5)
-
-    def test_attack_miss(self):
-        """Test missed attack."""
-        attacker_stats = {"STR": 8, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}  # Low STR
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=20, armor_class=20)  # Very high AC
-
-        combat = Combat(attacker, defender)
-        
-        # Run multiple attacks
-        misses = 0
-        for _ in range(20):
-            defender.hp = 20  # Reset HP
-            damage = combat.attack(attacker, defender)
-            if damage == 0:
-                misses += 1
-                assert defender.hp == 20  # HP unchanged
-
-        # With STR -1 vs AC 20, should miss most of the time
-        assert misses >= 10  # At least 50% miss rate (AC 20 very high)
-
-    def test_attack_reduces_hp(self):
-        """Test that attacks reduce defender HP."""
-        attacker_stats = {"STR": 20, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-        attacker.weapon = WEAPONS["Greatsword"]  # 2d6
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=50, armor_class=10)
-
-        combat = Combat(attacker, defender)
-        
-        initial_hp = defender.hp
+    combat = Combat(attacker, defender)
+    roll_source(n=10)
+
+    def attack_fresh():
+        defender.hp = 20  # Reset HP
         damage = combat.attack(attacker, defender)
-        
-        if damage > 0:  # If hit
-            assert defender.hp == initial_hp - damage
-            assert defender.hp < initial_hp
-
-    def test_attack_hp_not_negative(self):
-        """Test that HP doesn't go below 0."""
-        attacker_stats = {"STR": 20, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-        attacker.weapon = WEAPONS["Greataxe"]  # 1d12
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=1, armor_class=5)  # Very low HP and AC
-
-        combat = Combat(attacker, defender)
-        
-        # Attack multiple times to ensure a hit
-        for _ in range(20):
-            damage = combat.attack(attacker, defender)
-            if damage > 0:
-                assert defender.hp == 0  # Should be 0, not negative
-                break
-
-    def test_attack_with_different_weapons(self):
-        """Test attacks with different weapon types."""
-        attacker_stats = {"STR": 15, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=100, armor_class=5)  # Low AC for guaranteed hits
-
-        combat = Combat(attacker, defender)
-
-        # Test different weapons
-        weapons_to_test = ["Dagger", "Longsword", "Greatsword", "Greataxe"]
-        
-        for weapon_name in weapons_to_test:
-            attacker.weapon = WEAPONS[weapon_name]
-            defender.hp = 100  # Reset HP
-            
-            # Attack until we get a hit
-            for _ in range(20):
-                damage = combat.attack(attacker, defender)
-                if damage > 0:
-                    weapon = WEAPONS[weapon_name]
-                    # Damage should be within weapon's range
-                    assert 1 <= damage <= (weapon.damage_die * weapon.damage_dice_count)
-                    break
-
-    def test_attack_without_weapon_uses_unarmed(self):
-        """Test that entities without weapons use unarmed strike."""
-        attacker_stats = {"STR": 20, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-        attacker.weapon = None  # No weapon
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=20, armor_class=5)
-
-        combat = Combat(attacker, defender)
-        
-        # Attack until we get a hit
-        for _ in range(20):
-            defender.hp = 20
-            damage = combat.attack(attacker, defender)
-            if damage > 0:
-                assert damage == 1  # Unarmed strike deals 1 damage
-                break
-
-    def test_combat_round_tracking(self):
-        """Test that combat rounds are tracked."""
-        player_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        player = Character("Player", "Human", 10)
-        player.stats = player_stats
+        assert defender.hp == 20 - damage
+        return damage
+
+    # With STR +5 vs AC 10 every seeded attack hits for 1d8
+    assert [attack_fresh() for _ in range(5)] == [7, 3, 4, 3, 5]
+
+
+def test_attack_miss(attacker_template, defender_template, roll_source):
+    """Test missed attack."""
+    attacker = copy_with_stats(attacker_template, STR=8)  # Low STR
+
+    defender = copy_with_stats(defender_template)
+    defender.armor_class = 20  # Very high AC
+
+    combat = Combat(attacker, defender)
+    roll_source(n=10)
+
+    def attack_fresh():
+        defender.hp = 20  # Reset HP
+        damage = combat.attack(attacker, defender)
+        assert defender.hp == 20 - damage  # HP unchanged on a miss
+        return damage
+
+    # With STR -1 vs AC 20 every seeded attack misses
+    assert sum(attack_fresh() == 0 for _ in range(5)) == 5
+
+
+def test_attack_reduces_hp(attacker_template, defender_template):
+    """Test that attacks reduce defender HP."""
+    attacker = copy_with_stats(attacker_template, STR=20)
+    attacker.weapon = WEAPONS["Greatsword"]  # 2d6
+
+    defender = copy_with_stats(defender_template)
+    defender.hp = 50
+
+    combat = Combat(attacker, defender)
+    
+    initial_hp = defender.hp
+    damage = combat.attack(attacker, defender)
+    
+    if damage > 0:  # If hit
+        assert defender.hp == initial_hp - damage
+        assert defender.hp < initial_hp
+
+
+def test_attack_hp_not_negative(attacker_template, defender_template, max_rolls):
+    """Test that HP doesn't go below 0."""
+    attacker = copy_with_stats(attacker_template, STR=20)
+    attacker.weapon = WEAPONS["Greataxe"]  # 1d12
+
+    defender = copy_with_stats(defender_template)
+    defender.hp = 1
+    defender.armor_class = 5  # Very low HP and AC
+
+    combat = Combat(attacker, defender)
+
+    assert combat.attack(attacker, defender) == 12
+    assert defender.hp == 0  # Should be 0, not negative
+
+
+@pytest.mark.parametrize(
+    "weapon, weapon_name", _WEAPON_CASES, ids=[name for _, name in _WEAPON_CASES]
+)
+def test_attack_with_different_weapons(duel, max_rolls, weapon, weapon_name):
+    """Test attacks with different weapon types."""
+    attacker, defender, combat = duel
+    attacker.weapon = weapon
+
+    # A maximum roll deals the top of the weapon's damage range
+    damage = combat.attack(attacker, defender)
+    assert damage == _WEAPON_MAX[weapon_name]
+    assert defender.hp == 100 - damage
+
+
+def test_attack_without_weapon_uses_unarmed(
+    attacker_template, defender_template, max_rolls
+):
+    """Test that entities without weapons use unarmed strike."""
+    attacker = copy_with_stats(attacker_template, STR=20)
+    attacker.weapon = None  # No weapon
+
+    defender = copy_with_stats(defender_template)
+    defender.armor_class = 5
+
+    combat = Combat(attacker, defender)
+
+    assert combat.attack(attacker, defender) == 1  # Unarmed strike deals 1 damage
+    assert defender.hp == 19
+
+
+def test_combat_round_tracking(combat_basic):
+    """Test that combat rounds are tracked."""
+    assert combat_basic.round == 0
+    combat_basic.round += 1
+    assert combat_basic.round == 1
+    combat_basic.round += 1
+    assert combat_basic.round == 2
+
+
+def test_multiple_attacks_in_combat(attacker_template, defender_template, benchmark):
+    """Benchmark repeated attacks, checking the defender's HP after each one."""
+    attacker = copy_with_stats(attacker_template, STR=18)
+    attacker.weapon = WEAPONS["Longsword"]
+
+    defender = copy_with_stats(defender_template)
+    defender.armor_class = 12
+
+    combat = Combat(attacker, defender)
+
+    def fresh_defender():
+        defender.hp = 30
+        return (attacker, defender), {}
+
+    damage = benchmark.pedantic(
+        combat.attack, setup=fresh_defender, rounds=20, warmup_rounds=1
+    )
+
+    assert defender.hp == max(0, 30 - damage)
+
+
+def test_simulate_batch(attacker_template, defender_template):
+    """Test batch simulation returns a non-increasing HP trajectory."""
+    attacker = copy_with_stats(attacker_template, STR=16)
+    attacker.weapon = WEAPONS["Greatsword"]  # 2d6
+
+    defender = copy_with_stats(defender_template)
+    defender.hp = 500
+    defender.armor_class = 12
+
+    combat = Combat(attacker, defender)
+    trajectory = combat.simulate_batch(attacker, defender, 100)
+
+    assert len(trajectory) == 100
+    assert all(a >= b for a, b in zip(trajectory, trajectory[1:]))
+    assert 500 - trajectory[0] <= 12  # At most one 2d6 hit so far
+    assert trajectory[-1] >= 0
+    assert defender.hp == 500  # Simulation does not touch the defender
+
+
+def test_simulate_batch_all_miss():
+    """Test batch simulation when every attack misses."""
+    stats = stats_with()
+    attacker = Enemy("Attacker", stats, hp=10)
+    defender = Enemy("Defender", stats, hp=10, armor_class=30)
+
+    combat = Combat(attacker, defender)
+
+    assert combat.simulate_batch(attacker, defender, 10) == [10] * 10
+
+
+@pytest.mark.parametrize("armor_class", [5, 30])  # Every attack hits, or none does
+@pytest.mark.parametrize("batched", [False, True])
+def test_attack_paths_agree(
+    attacker_template, defender_template, max_rolls, armor_class, batched
+):
+    """Test that Combat.attack and simulate_batch resolve attacks the same way."""
+    attacker = copy_with_stats(attacker_template, STR=14)
+    attacker.weapon = WEAPONS["Greatsword"]  # 2d6
+    defender = copy_with_stats(defender_template)
+    defender.hp = 100
+    defender.armor_class = armor_class
+    combat = Combat(attacker, defender)
+
+    if batched:
+        trajectory = combat.simulate_batch(attacker, defender, 5)
+    else:
+        trajectory = []
+        for _ in range(5):
+            combat.attack(attacker, defender)
+            trajectory.append(defender.hp)
+
+    expected_damage = 12 if armor_class == 5 else 0
+    assert trajectory == [100 - expected_damage * i for i in range(1, 6)]
+
+
+def test_simulate_combats():
+    """Test that fights the player cannot lose are all won."""
+    stats = stats_with()
+    player = Enemy("Player", stats, hp=10, armor_class=30)  # Never hit
+    enemy = Enemy("Enemy", stats, hp=3, armor_class=1)  # Always hit, 1 damage
+
+    results = simulate_combats(player, enemy, 50)
+
+    assert results == [True] * 50
+    assert player.hp == 10 and enemy.hp == 3  # Entities are untouched
+
+
+def test_simulate_combats_undecided_is_loss():
+    """Test that fights nobody can win count as losses."""
+    stats = stats_with()
+    player = Enemy("Player", stats, hp=10, armor_class=30)
+    enemy = Enemy("Enemy", stats, hp=10, armor_class=30)
 
-        enemy_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        enemy = Enemy("Enemy", enemy_stats, hp=10)
-
-        combat = Combat(player, enemy)
-
-        assert combat.round == 0
-        combat.round += 1
-        assert combat.round == 1
-        combat.round += 1
-        assert combat.round == 2
-
-    def test_multiple_attacks_in_combat(self):
-        """Test multiple attacks in a combat scenario."""
-        attacker_stats = {"STR": 18, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        attacker = Character("Attacker", "Human", 10)
-        attacker.stats = attacker_stats
-        attacker.weapon = WEAPONS["Longsword"]
-
-        defender_stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-        defender = Enemy("Defender", defender_stats, hp=30, armor_class=12)
-
-        combat = Combat(attacker, defender)
-        
-        total_damage = 0
-        attacks = 0
-        
-        # Simulate several rounds of combat
-        while defender.hp > 0 and attacks < 20:
-            damage = combat.attack(attacker, defender)
-            total_damage += damage
-            attacks += 1
-
-        assert defender.hp == max(0, 30 - total_damage)
-        assert not defender.is_alive() or attacks == 20
+    assert simulate_combats(player, enemy, 10, max_rounds=5) == [False] * 10
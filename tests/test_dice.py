@@ -1,5 +1,14 @@
+import random
+import threading
 from unittest.mock import patch
-from dndgame.dice import roll, roll_with_advantage, roll_with_disadvantage
+from dndgame.dice import (
+    get_rng,
+    roll,
+    roll_batch,
+    roll_with_advantage,
+    roll_with_disadvantage,
+    set_rng,
+)
 
 
 def test_roll():
@@ -54,3 +63,69 @@ def test_roll_with_disadvantage():
     ):  # random.randint will first return 6, then 2 when called in this context
         result = roll_with_disadvantage(6)
         assert result == 2  # 2 is the lowest of the two rolls
+
+
+def test_roll_bulk():
+    """Test that large rolls use the bulk path and stay in range."""
+    with patch("random.randint") as randint:
+        result = roll(6, 100)
+        randint.assert_not_called()
+    assert 100 <= result <= 600
+
+
+def test_roll_batch():
+    """Test that batched rolls return one in-range total per roll."""
+    totals = roll_batch(6, 2, 500)
+    assert len(totals) == 500
+    assert all(2 <= total <= 12 for total in totals)
+
+    with patch("random.randint", side_effect=[3, 4, 5, 6]):
+        assert roll_batch(6, 2, 2) == [7, 11]
+
+
+def test_roll_batch_no_dice():
+    """Test that batches of zero dice total 0, like roll()."""
+    assert roll(6, 0) == 0
+    assert roll_batch(6, 0, 3) == [0, 0, 0]
+
+
+def test_roll_silent_by_default(capsys):
+    """Test that rolls print nothing unless verbose output is enabled."""
+    with patch("random.randint", return_value=4):
+        assert roll(6, 2) == 8
+    assert capsys.readouterr().out == ""
+
+
+def test_roll_verbose(capsys, verbose):
+    """Test that rolls are printed when verbose output is enabled."""
+    with patch("random.randint", return_value=4):
+        roll(6, 2)
+    assert "Rolling 2d6: [4, 4] = 8" in capsys.readouterr().out
+
+
+def test_set_rng_reproducible():
+    """Test that seeded generators give reproducible rolls."""
+    try:
+        set_rng(random.Random(42))
+        first = [roll(20, 1) for _ in range(10)] + [roll(6, 100)]
+        set_rng(random.Random(42))
+        second = [roll(20, 1) for _ in range(10)] + [roll(6, 100)]
+    finally:
+        set_rng(None)
+
+    assert first == second
+    assert get_rng() is random
+
+
+def test_set_rng_is_per_thread():
+    """Test that a generator set on one thread does not leak to others."""
+    seen = []
+    try:
+        set_rng(random.Random(0))
+        worker = threading.Thread(target=lambda: seen.append(get_rng()))
+        worker.start()
+        worker.join()
+    finally:
+        set_rng(None)
+
+    assert seen == [random]
@@ -1,7 +1,52 @@
 """Tests for the DungeonMaster class."""
 
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+import httpx
+import openai
 import pytest
-from dndgame.dungeon_master import DungeonMaster
+from dndgame import dungeon_master
+from dndgame.dungeon_master import NARRATION_VARIANTS, SYSTEM_PROMPT, DungeonMaster, _TokenBucket
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that records concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        text = f"narration {len(self.calls)}"
+        if kwargs.get("stream"):
+            return stream_chunks(text.split(" "))
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+async def stream_chunks(words):
+    """Yield streamed completion chunks, one word per chunk."""
+    for i, word in enumerate(words):
+        delta = SimpleNamespace(content=word if i == 0 else f" {word}")
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def make_enabled_dm(**kwargs):
+    """Create a DungeonMaster wired to a fake OpenAI client."""
+    dm = DungeonMaster(enabled=False, **kwargs)
+    dm.enabled = True
+    completions = FakeCompletions()
+    dm.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return dm, completions
 
 
 def test_dungeon_master_disabled():
@@ -10,23 +55,264 @@ def test_dungeon_master_disabled():
     assert dm.enabled is False
 
     # All narration methods should return None when disabled
-    assert dm.narrate_combat_start("Player", "Goblin") is None
-    assert dm.narrate_attack("Player", "Goblin", "Sword", 5, True) is None
-    assert dm.narrate_spell_cast("Player", "Goblin", "Fireball", 10) is None
-    assert dm.narrate_victory("Player", "Goblin") is None
-    assert dm.narrate_defeat("Player", "Goblin") is None
-    assert dm.narrate_action_choice("Player", ["attack", "defend"]) is None
+    assert asyncio.run(dm.narrate_combat_start("Player", "Goblin")) is None
+    assert asyncio.run(dm.narrate_attack("Player", "Goblin", "Sword", 5, True)) is None
+    assert asyncio.run(dm.narrate_spell_cast("Player", "Goblin", "Fireball", 10)) is None
+    assert asyncio.run(dm.narrate_victory("Player", "Goblin")) is None
+    assert asyncio.run(dm.narrate_defeat("Player", "Goblin")) is None
+    assert asyncio.run(dm.narrate_action_choice("Player", ["attack", "defend"])) is None
 
 
-def test_dungeon_master_without_api_key():
-    """Test that DungeonMaster handles missing API key gracefully."""
-    # This should auto-disable if API key is not configured
+def test_narrate_many_disabled():
+    """Test that narrate_many returns one result per narration, in order."""
+    dm = DungeonMaster(enabled=False)
+
+    results = asyncio.run(
+        dm.narrate_many(
+            dm.narrate_attack("Player", "Goblin", "Sword", 5, True),
+            dm.narrate_victory("Player", "Goblin"),
+        )
+    )
+
+    assert results == [None, None]
+
+
+def test_dungeon_master_without_api_key(monkeypatch, capsys):
+    """Test that DungeonMaster disables itself when no API key is set."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    dm = DungeonMaster(enabled=True)
+
+    assert dm.enabled is False
+    assert "API key not configured" in capsys.readouterr().out
+    assert asyncio.run(dm.narrate_combat_start("Player", "Goblin")) is None
+
+
+@pytest.mark.skipif(
+    os.getenv("OPENAI_API_KEY") in (None, "", "your_api_key_here"),
+    reason="OPENAI_API_KEY is not configured",
+)
+def test_dungeon_master_with_api_key():
+    """Test a real narration request when an API key is configured."""
     dm = DungeonMaster(enabled=True)
 
-    # If API key is not set or is placeholder, should be disabled
-    # Note: This test may pass or fail depending on if .env has a real API key
-    # The important part is that it doesn't crash
-    result = dm.narrate_combat_start("Player", "Goblin")
+    async def narrate_and_close():
+        try:
+            return await dm.narrate_combat_start("Player", "Goblin")
+        finally:
+            await dm.close()
 
-    # Result should either be None (disabled) or a string (enabled with valid API key)
+    # The request itself may still fail, in which case the DM returns None
+    result = asyncio.run(narrate_and_close())
     assert result is None or isinstance(result, str)
+
+
+def test_narrate_many_runs_concurrently():
+    """Test that narrate_many issues its requests at the same time."""
+    dm, completions = make_enabled_dm()
+
+    results = asyncio.run(
+        dm.narrate_many(
+            dm.narrate_attack("Player", "Goblin", "Sword", 5, True),
+            dm.narrate_victory("Player", "Goblin"),
+        )
+    )
+
+    assert len(completions.calls) == 2
+    assert completions.max_in_flight == 2
+    assert all(isinstance(result, str) for result in results)
+
+
+def test_concurrent_requests_are_capped():
+    """Test that no more than max_concurrent_requests are in flight."""
+    dm, completions = make_enabled_dm(max_concurrent_requests=2)
+
+    asyncio.run(
+        dm.narrate_many(
+            *(dm.narrate_attack("Player", "Goblin", "Sword", damage, True) for damage in range(5))
+        )
+    )
+
+    assert len(completions.calls) == 5
+    assert completions.max_in_flight == 2
+
+
+def api_error(error_type, status_code):
+    """Build an OpenAI API error for the given HTTP status."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return error_type("error", response=response, body=None)
+
+
+def test_rate_limited_requests_are_retried(monkeypatch):
+    """Test that rate-limit errors are retried with growing delays."""
+    dm, completions = make_enabled_dm()
+    errors = [api_error(openai.RateLimitError, 429), api_error(openai.InternalServerError, 500)]
+    create = completions.create
+
+    async def flaky_create(**kwargs):
+        if errors:
+            raise errors.pop(0)
+        return await create(**kwargs)
+
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    completions.create = flaky_create
+    monkeypatch.setattr(asyncio, "sleep", record_sleep)
+
+    assert asyncio.run(dm.narrate_victory("Player", "Goblin")) == "narration 1"
+    assert len(delays) == 3  # two backoffs, then the fake's own sleep
+    assert 0.5 <= delays[0] < 0.6
+    assert 1.0 <= delays[1] < 1.1
+
+
+def test_token_bucket_waits_once_empty(monkeypatch):
+    """Test that acquire spends a full bucket at once, then waits for a refill."""
+    now = [100.0]
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def advance_clock(delay):
+        delays.append(delay)
+        now[0] += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(dungeon_master, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(asyncio, "sleep", advance_clock)
+    bucket = _TokenBucket(2, per_seconds=10)  # One token every 5 seconds
+
+    async def spend(count):
+        for _ in range(count):
+            await bucket.acquire()
+
+    asyncio.run(spend(2))
+    assert delays == []
+
+    asyncio.run(spend(1))
+    assert delays == [pytest.approx(5.0)]
+
+
+def test_client_errors_are_not_retried():
+    """Test that errors a retry cannot fix give up straight away."""
+    dm, completions = make_enabled_dm()
+    attempts = []
+
+    async def bad_request(**kwargs):
+        attempts.append(kwargs)
+        raise api_error(openai.BadRequestError, 400)
+
+    completions.create = bad_request
+
+    assert asyncio.run(dm.narrate_victory("Player", "Goblin")) is None
+    assert len(attempts) == 1
+
+
+def test_streamed_narration_is_printed(capsys):
+    """Test that streamed narrations are printed as they arrive and returned."""
+    dm, completions = make_enabled_dm()
+
+    narration = asyncio.run(dm.narrate_combat_start("Player", "Goblin", stream=True))
+
+    assert narration == "narration 1"
+    assert completions.calls[0]["stream"] is True
+    assert capsys.readouterr().out == "🎲 narration 1\n"
+
+
+def test_stream_failing_midway_is_not_retried(capsys):
+    """Test that a stream dropped after printing tokens is not requested again."""
+    dm, completions = make_enabled_dm()
+
+    async def dropped_stream():
+        async for chunk in stream_chunks(["The", "goblin"]):
+            yield chunk
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        raise openai.APIConnectionError(request=request)
+
+    async def create(**kwargs):
+        completions.calls.append(kwargs)
+        return dropped_stream()
+
+    completions.create = create
+
+    assert asyncio.run(dm.narrate_combat_start("Player", "Goblin", stream=True)) is None
+    assert len(completions.calls) == 1
+    out = capsys.readouterr().out
+    assert out.count("The goblin") == 1
+    assert "DM narration error" in out
+
+
+def test_cached_narration_is_printed_when_streaming(capsys):
+    """Test that cached narrations are printed too and share the cache."""
+    dm, completions = make_enabled_dm()
+    for _ in range(NARRATION_VARIANTS):
+        asyncio.run(dm.narrate_victory("Player", "Goblin"))
+    assert capsys.readouterr().out == ""
+
+    narration = asyncio.run(dm.narrate_victory("Player", "Goblin", stream=True))
+
+    assert len(completions.calls) == NARRATION_VARIANTS
+    assert capsys.readouterr().out == f"🎲 {narration}\n"
+
+
+def test_close_pools_connections(monkeypatch):
+    """Test that the OpenAI client uses a shared pool that close() shuts."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    dm = DungeonMaster(enabled=True)
+
+    assert dm.client._client is dm._http
+    asyncio.run(dm.close())
+    assert dm._http.is_closed
+
+    # Closing a disabled DM is a no-op
+    asyncio.run(DungeonMaster(enabled=False).close())
+
+
+def test_requests_share_system_prompt():
+    """Test that every request starts with the same cacheable system prompt."""
+    dm, completions = make_enabled_dm()
+
+    asyncio.run(dm.narrate_combat_start("Player", "Goblin"))
+    asyncio.run(dm.narrate_defeat("Player", "Goblin"))
+
+    for call in completions.calls:
+        assert call["messages"][0] == {"role": "system", "content": SYSTEM_PROMPT}
+        assert "Dungeon Master" not in call["messages"][1]["content"]
+
+
+def test_repeated_narrations_are_cached():
+    """Test that repeated events stop calling the API once variants exist."""
+    dm, completions = make_enabled_dm()
+
+    results = [
+        asyncio.run(dm.narrate_attack("Player", "Goblin", "Sword", 5, True))
+        for _ in range(NARRATION_VARIANTS + 5)
+    ]
+
+    assert len(completions.calls) == NARRATION_VARIANTS
+    assert set(results) == set(results[:NARRATION_VARIANTS])
+
+    # A different event is not served from the cache
+    asyncio.run(dm.narrate_attack("Player", "Goblin", "Sword", 6, True))
+    assert len(completions.calls) == NARRATION_VARIANTS + 1
+
+
+def test_corpus_narrations_skip_api(tmp_path):
+    """Test that pre-generated narrations are used before calling the API."""
+    corpus_path = tmp_path / "narrations.json"
+    corpus_path.write_text(
+        json.dumps({"attack|Sword|hit|5": ["{attacker} cleaves {defender}."]})
+    )
+    dm, completions = make_enabled_dm(corpus_path=corpus_path)
+
+    narration = asyncio.run(dm.narrate_attack("Aragorn", "Goblin", "Sword", 5, True))
+
+    assert narration == "Aragorn cleaves Goblin."
+    assert completions.calls == []
+
+    # Events missing from the corpus fall back to the API
+    asyncio.run(dm.narrate_attack("Aragorn", "Goblin", "Sword", 0, False))
+    assert len(completions.calls) == 1
@@ -0,0 +1,36 @@
+"""Tests for the interactive game's helpers in main.py."""
+
+import asyncio
+
+from main import NarrationPrinter
+
+
+async def narration(text):
+    """Stand-in DM narration that returns the given text."""
+    return text
+
+
+async def failing_narration():
+    """Stand-in DM narration whose request fails."""
+    raise RuntimeError("connection lost")
+
+
+def test_narration_printer_skips_failed_narration(capsys):
+    """Test that a failing narration is reported and later ones still print."""
+
+    async def run():
+        printer = NarrationPrinter()
+        await printer.submit(narration("The goblin snarls."))
+        await printer.submit(failing_narration())
+        await asyncio.wait_for(printer.flush(), timeout=1)
+
+        await printer.submit(narration("The goblin falls."))
+        await asyncio.wait_for(printer.flush(), timeout=1)
+        await asyncio.wait_for(printer.close(), timeout=1)
+
+    asyncio.run(run())
+
+    out = capsys.readouterr().out
+    assert "DM narration error: connection lost" in out
+    assert out.index("The goblin snarls.") < out.index("connection lost")
+    assert out.index("connection lost") < out.index("The goblin falls.")
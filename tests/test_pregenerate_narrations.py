@@ -0,0 +1,60 @@
+"""Tests for the narration pre-generation script."""
+
+import json
+
+from dndgame.dungeon_master import (
+    ATTACKER_PLACEHOLDER,
+    DEFENDER_PLACEHOLDER,
+    NARRATION_VARIANTS,
+    DungeonMaster,
+)
+from scripts.pregenerate_narrations import build_requests, parse_results
+
+
+def test_build_requests():
+    """Test that every event gets uniquely identified request variants."""
+    requests = build_requests()
+    custom_ids = [request["custom_id"] for request in requests]
+
+    assert len(custom_ids) == len(set(custom_ids))
+    assert "attack|Greatsword|hit|12#0" in custom_ids
+    assert "attack|Greatsword|hit|1#0" not in custom_ids  # 2d6 can't roll 1
+    assert f"spell|Fireball|15#{NARRATION_VARIANTS - 1}" in custom_ids
+
+
+def test_build_requests_use_dungeon_master_templates():
+    """Test that batch prompts and settings match what live narration sends."""
+    requests = {request["custom_id"]: request["body"] for request in build_requests()}
+    body = requests["attack|Longsword|hit|8#0"]
+    prompt, max_tokens, temperature = DungeonMaster.prompt(
+        "attack_hit",
+        attacker=ATTACKER_PLACEHOLDER,
+        defender=DEFENDER_PLACEHOLDER,
+        weapon="Longsword",
+        damage=8,
+    )
+
+    assert body["messages"][1]["content"].startswith(prompt)
+    assert (body["max_tokens"], body["temperature"]) == (max_tokens, temperature)
+
+
+def test_parse_results():
+    """Test that batch output is grouped by event and failures are skipped."""
+
+    def line(custom_id, status, content):
+        body = {"choices": [{"message": {"content": content}}]}
+        return json.dumps(
+            {"custom_id": custom_id, "response": {"status_code": status, "body": body}}
+        )
+
+    output = "\n".join(
+        [
+            line("attack|Dagger|miss|0#0", 200, " A whiff! "),
+            line("attack|Dagger|miss|0#1", 200, "Another miss."),
+            line("attack|Dagger|miss|0#2", 500, "ignored"),
+        ]
+    )
+
+    assert parse_results(output) == {
+        "attack|Dagger|miss|0": ["A whiff!", "Another miss."]
+    }
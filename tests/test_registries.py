@@ -0,0 +1,26 @@
+"""Sanity checks for the module-level weapon and spell registries."""
+
+import pytest
+
+from dndgame.spells import SPELLS, get_spellbook
+from dndgame.weapons import WEAPONS
+
+pytestmark = pytest.mark.smoke
+
+
+def test_weapons_registry():
+    """Test that weapons registry is populated."""
+    assert len(WEAPONS) > 0
+    assert "Longsword" in WEAPONS
+    assert "Dagger" in WEAPONS
+
+
+def test_get_spellbook():
+    """Test getting the global spellbook."""
+    spellbook = get_spellbook()
+
+    assert spellbook is SPELLS
+    assert isinstance(spellbook, dict)
+    assert len(spellbook) > 0
+    assert "Fireball" in spellbook
+    assert "Magic Missile" in spellbook
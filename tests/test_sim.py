@@ -0,0 +1,38 @@
+"""Tests for the sim module."""
+
+from dndgame.character import Enemy
+from dndgame.sim import EnemyPool
+from tests.helpers import stats_with
+
+STATS = stats_with(STR=14)
+
+
+def test_enemy_pool_copies_enemies():
+    """Test that the pool holds each enemy's combat attributes."""
+    enemies = [
+        Enemy("Goblin", STATS, hp=5, armor_class=10),
+        Enemy("Orc", STATS, hp=15, armor_class=13),
+    ]
+
+    pool = EnemyPool(enemies)
+
+    assert len(pool) == 2
+    assert list(pool.hp) == [5, 15]
+    assert list(pool.ac) == [10, 13]
+    assert list(pool.alive) == [1, 1]
+
+
+def test_resolve_attacks():
+    """Test that hits reduce HP, misses don't, and defeated enemies are skipped."""
+    enemies = [Enemy(f"Goblin {i}", STATS, hp=5, armor_class=10) for i in range(3)]
+    pool = EnemyPool(enemies)
+
+    # Hit for 8 (defeats), miss, hit for 2
+    assert pool.resolve_attacks([15, 5, 10], [8, 8, 2]) == [8, 0, 2]
+    assert list(pool.hp) == [0, 5, 3]
+    assert list(pool.alive) == [0, 1, 1]
+
+    # The defeated goblin can no longer be hit; STR modifier turns a 9 into a hit
+    assert pool.resolve_attacks([20, 9, 1], [4, 4, 4], str_mod=1) == [0, 4, 0]
+    assert list(pool.hp) == [0, 1, 3]
+    assert all(enemy.hp == 5 for enemy in enemies)  # Source enemies untouched
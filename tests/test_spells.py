@@ -1,14 +1,51 @@
 import pytest
+from dndgame.character import Character
 from dndgame.spells import Spell, SpellBook
+from tests.helpers import stats_with
+
+# (caster INT score, spell power, expected damage)
+SPELL_CAST_CASES = [
+    (16, 5, 8),  # INT +3
+    (10, 5, 5),  # INT +0
+    (20, 1, 6),  # INT +5
+    (8, 0, 0),  # INT -1 would be negative, clamped to 0
+    (3, -10, 0),  # INT -4 and negative power, clamped to 0
+    (10, 15, 15),  # More damage than the target has HP
+]
+
+# (Spell arguments, expected str())
+SPELL_STR_CASES = [
+    (("Fire Bolt", 0, "Evocation", 5), "Fire Bolt (Cantrip, Evocation, Power: 5)"),
+    (("Fireball", 3, "Evocation", 15), "Fireball (Level 3, Evocation, Power: 15)"),
+    (("Cure Wounds", 1, "Evocation", -5), "Cure Wounds (Level 1, Evocation, Power: -5)"),
+]
+
+
+@pytest.fixture(scope="module")
+def caster():
+    """A caster shared by the spell cast cases; each case sets its stats."""
+    caster = Character.blank()
+    caster.name = "Wizard"
+    return caster
+
+
+@pytest.fixture(scope="module")
+def target():
+    """A target shared by the spell cast cases; each case resets its HP."""
+    target = Character.blank()
+    target.name = "Target"
+    target.stats = stats_with()
+    target.max_hp = 10
+    return target
 
 
-def test_spell_creation():
-    """Test spell initialization with all attributes."""
-    spell = Spell("Fireball", 3, "Evocation", 8)
-    assert spell.name == "Fireball"
-    assert spell.level == 3
-    assert spell.school == "Evocation"
-    assert spell.spell_power == 8
+@pytest.mark.parametrize("args, expected_str", SPELL_STR_CASES)
+def test_spell_creation(args, expected_str):
+    """Test spell initialization and its string representation."""
+    spell = Spell(*args)
+
+    assert (spell.name, spell.level, spell.school, spell.spell_power) == args
+    assert str(spell) == expected_str
 
 
 def test_spellbook_creation():
@@ -51,6 +88,8 @@ def test_get_available_spells():
     level_3_spells = spellbook.get_available_spells(3)
     assert len(level_3_spells) == 3
     assert all(spell.level <= 3 for spell in level_3_spells)
+    # Spells come back in the order they were added
+    assert [spell.name for spell in level_3_spells] == ["Magic Missile", "Fireball", "Shield"]
 
 
 def test_empty_spellbook_available_spells():
@@ -60,77 +99,67 @@ def test_empty_spellbook_available_spells():
     assert len(available) == 0
 
 
-def test_spell_cast():
-    """Test spell cast method."""
-    from dndgame.character import Character
+@pytest.mark.parametrize("int_score, spell_power, expected_damage", SPELL_CAST_CASES)
+def test_spell_cast(caster, target, int_score, spell_power, expected_damage):
+    """Test that a cast deals spell_power + INT modifier, clamped to 0."""
+    caster.stats = stats_with(INT=int_score)
+    target.hp = 10
 
-    # Create a simple caster and target
-    caster = Character("Wizard", "Human", 10)
-    caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 16, "WIS": 10, "CHA": 10}
-    caster.hp = 10
-    caster.max_hp = 10
+    damage = Spell("Test Spell", 1, "Test", spell_power).cast(caster, target)
 
-    target = Character("Target", "Human", 10)
-    target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    target.hp = 10
-    target.max_hp = 10
+    assert damage == expected_damage
+    assert target.hp == max(0, 10 - expected_damage)
 
-    spell = Spell("Test Spell", 1, "Test", 5)
-    initial_target_hp = target.hp
 
-    # Cast spell - should deal spell_power + INT modifier damage
-    # INT 16 = +3 modifier, so damage should be 5 + 3 = 8
-    damage = spell.cast(caster, target)
-    assert damage == 8
-    assert target.hp == initial_target_hp - 8
+def test_spell_cast_batch():
+    """Test that batched casts match single casts and clamp at 0."""
+    spell = Spell("Magic Missile", 1, "Evocation", 7)
 
+    # INT -4 still deals 3, INT +3 deals 10, and HP never drops below 0
+    assert spell.cast_batch([-4, 3, 0], [20, 20, 5]) == [17, 10, 0]
+    assert Spell("Weak Spell", 1, "Test", -10).cast_batch([2], [10]) == [10]
 
-def test_spell_string_representation_cantrip():
-    """Test string representation of a cantrip."""
-    spell = Spell("Fire Bolt", 0, "Evocation", 5)
-    assert str(spell) == "Fire Bolt (Cantrip, Evocation, Power: 5)"
 
+def test_get_available_spells_after_add():
+    """Test that spells added after a lookup are included in the next one."""
+    spellbook = SpellBook()
+    spellbook.add_spell(Spell("Fireball", 3, "Evocation", 8))
+    spellbook.add_spell(Spell("Fire Bolt", 0, "Evocation", 5))
 
-def test_spell_string_representation_leveled():
-    """Test string representation of a leveled spell."""
-    spell = Spell("Fireball", 3, "Evocation", 15)
-    assert str(spell) == "Fireball (Level 3, Evocation, Power: 15)"
+    available = spellbook.get_available_spells(3)
+    assert [spell.name for spell in available] == ["Fireball", "Fire Bolt"]
 
+    # Changing the returned list must not affect the spellbook
+    available.clear()
+    assert len(spellbook.get_available_spells(3)) == 2
 
-def test_spell_cast_negative_damage_clamped_to_zero():
-    """Test that negative damage is clamped to 0."""
-    from dndgame.character import Character
+    spellbook.add_spell(Spell("Shield", 1, "Abjuration", 2))
+    assert [spell.name for spell in spellbook.get_available_spells(3)] == [
+        "Fireball",
+        "Fire Bolt",
+        "Shield",
+    ]
 
-    caster = Character("Wizard", "Human", 10)
-    # Very low INT and negative spell power
-    caster.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 3, "WIS": 10, "CHA": 10}  # INT 3 = -4 modifier
-    caster.hp = 10
-    caster.max_hp = 10
 
-    target = Character("Target", "Human", 10)
-    target.stats = {"STR": 10, "DEX": 10, "CON": 10, "INT": 10, "WIS": 10, "CHA": 10}
-    target.hp = 10
-    target.max_hp = 10
+def test_spell_and_spellbook_use_slots():
+    """Test that spells and spellbooks have no per-instance __dict__."""
+    spell = Spell("Fireball", 3, "Evocation", 8)
+    spellbook = SpellBook()
 
-    # Spell with negative power that will result in overall negative damage
-    spell = Spell("Weak Spell", 1, "Test", -10)
-    initial_target_hp = target.hp
+    assert not hasattr(spell, "__dict__")
+    assert not hasattr(spellbook, "__dict__")
+    with pytest.raises(AttributeError):
+        spell.range = 150
 
-    damage = spell.cast(caster, target)
-    
-    # Damage should be clamped to 0
-    assert damage == 0
-    assert target.hp == initial_target_hp  # Target HP shouldn't change
 
+def test_get_spell_is_shared_with_registry():
+    """Test that spells are built once and shared with SPELLS."""
+    from dndgame.spells import SPELLS, get_spell
 
-def test_get_spellbook():
-    """Test getting the global spellbook."""
-    from dndgame.spells import get_spellbook, SPELLS
+    fireball = get_spell("Fireball")
+    assert fireball is get_spell("Fireball")
+    assert fireball is SPELLS["Fireball"]
+    assert (fireball.level, fireball.school, fireball.spell_power) == (3, "Evocation", 15)
 
-    spellbook = get_spellbook()
-    
-    assert spellbook is SPELLS
-    assert isinstance(spellbook, dict)
-    assert len(spellbook) > 0
-    assert "Fireball" in spellbook
-    assert "Magic Missile" in spellbook
+    with pytest.raises(KeyError):
+        get_spell("Wish")
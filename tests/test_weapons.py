@@ -1,6 +1,8 @@
 """Tests for the weapons module."""
 
-from dndgame.weapons import Weapon, WEAPONS
+import pytest
+
+from dndgame.weapons import Weapon, WEAPONS, get_weapon
 
 
 def test_weapon_string_representation():
@@ -12,8 +14,21 @@ def test_weapon_string_representation():
     assert str(weapon2) == "Greatsword (2d6)"
 
 
-def test_weapons_registry():
-    """Test that weapons registry is populated."""
-    assert len(WEAPONS) > 0
-    assert "Longsword" in WEAPONS
-    assert "Dagger" in WEAPONS
+def test_weapon_uses_slots():
+    """Test that weapons have no per-instance __dict__."""
+    weapon = Weapon("Test Sword", damage_die=8)
+
+    assert not hasattr(weapon, "__dict__")
+    with pytest.raises(AttributeError):
+        weapon.weight = 3
+
+
+def test_get_weapon_is_shared_with_registry():
+    """Test that weapons are built once and shared with WEAPONS."""
+    dagger = get_weapon("Dagger")
+    assert dagger is get_weapon("Dagger")
+    assert dagger is WEAPONS["Dagger"]
+    assert str(dagger) == "Dagger (1d4)"
+
+    with pytest.raises(KeyError):
+        get_weapon("Lightsaber")